@@ -0,0 +1,189 @@
+"""Disk cache for catalog-level scoring artifacts keyed by catalog content."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from collections.abc import Mapping
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.decomposition import PCA
+from sklearn.preprocessing import StandardScaler
+
+from recommender import schema
+from recommender.cluster import fit_pca, weighted_projection
+from recommender.preprocess import fit_scaler, transform
+from recommender.weightings import apply_weights, validate_feature_weights, weight_vector
+from utils.merge_datasets import _loaded_catalog_identity, _write_atomically
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_SCHEMA_VERSION = 2
+# Unit-length PCA rows only feed cosine rankings, which tolerate half
+# precision; storing them as float16 halves the bytes read per query.
+EMBEDDING_DTYPE = np.float16
+
+
+def _digest(payload: object) -> str:
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.sha256(blob).hexdigest()[:12]
+
+
+def _artifact_path(
+    source: pd.DataFrame, kind: str, payload: object, suffix: str = ".joblib"
+) -> Path | None:
+    """
+    Resolve the cache path for an artifact fitted on ``source``, or None when
+    ``source`` is not a catalog returned by utils.merge_datasets.get_merged_dataset.
+    """
+    # Derived frames (sorted, filtered, assigned) are never registered, so
+    # positional artifacts always match the rows of the frame they were built on.
+    identity = _loaded_catalog_identity(source)
+    if identity is None:
+        return None
+    content_key, cache_dir = identity
+
+    key = _digest(
+        {
+            "artifact_schema_version": ARTIFACT_SCHEMA_VERSION,
+            "clip_bounds": schema.CLIP_BOUNDS,
+            **payload,
+        }
+    )
+    return Path(cache_dir) / f"{kind}_{content_key}-{key}{suffix}"
+
+
+def _load_or_fit(path: Path | None, fit, load=joblib.load, dump=joblib.dump):
+    if path is None:
+        return fit()
+    if path.exists():
+        logger.debug("Using cached scoring artifact %s", path.name)
+        return load(path)
+
+    artifact = fit()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomically(path, f".tmp{path.suffix}", lambda temporary: dump(artifact, temporary))
+    except OSError:
+        logger.warning("Could not cache scoring artifact %s", path, exc_info=True)
+    return artifact
+
+
+def cached_scaler(source: pd.DataFrame, feature_cols: list[str]) -> StandardScaler:
+    """Return fit_scaler(source, feature_cols), reusing a cached fit when possible."""
+    path = _artifact_path(source, "scaler", {"feature_cols": list(feature_cols)})
+    return _load_or_fit(path, lambda: fit_scaler(source, feature_cols))
+
+
+def _load_memmap(path: Path) -> np.ndarray:
+    return np.load(path, mmap_mode="r")
+
+
+def _save_array(array: np.ndarray, path: Path) -> None:
+    np.save(path, array)
+
+
+def cached_scaled_features(
+    source: pd.DataFrame, scaler: StandardScaler, feature_cols: list[str]
+) -> np.ndarray | None:
+    """
+    Return transform(source, scaler, feature_cols) as a float32 matrix,
+    memory-mapped from the cache, or None when ``source`` is not cacheable.
+    """
+    path = _artifact_path(
+        source,
+        "catalog_scaled",
+        {"feature_cols": list(feature_cols), "dtype": np.dtype(np.float32).name},
+        suffix=".npy",
+    )
+    if path is None:
+        return None
+    return _load_or_fit(
+        path,
+        lambda: transform(source, scaler, feature_cols),
+        load=_load_memmap,
+        dump=_save_array,
+    )
+
+
+def _scaled_source(
+    source: pd.DataFrame, scaler: StandardScaler, feature_cols: list[str]
+) -> np.ndarray:
+    cached = cached_scaled_features(source, scaler, feature_cols)
+    return cached if cached is not None else transform(source, scaler, feature_cols)
+
+
+def _pca_payload(feature_cols, weights, n_components) -> dict:
+    return {
+        "feature_cols": list(feature_cols),
+        "weights": weights,
+        "n_components": n_components,
+    }
+
+
+def cached_pca(
+    source: pd.DataFrame,
+    scaler: StandardScaler,
+    feature_cols: list[str],
+    weights: Mapping[str, float] | None,
+    n_components: int,
+) -> PCA:
+    """
+    Fit PCA on the scaled (and optionally weighted) ``source`` features,
+    reusing a cached fit for the same dataset, weights, and component count.
+    """
+    validated = validate_feature_weights(weights) if weights is not None else None
+    path = _artifact_path(source, "pca", _pca_payload(feature_cols, validated, n_components))
+
+    def fit() -> PCA:
+        X_source = _scaled_source(source, scaler, feature_cols)
+        if validated is not None:
+            X_source = apply_weights(X_source, validated, feature_cols)
+        return fit_pca(X_source, n_components=n_components)
+
+    return _load_or_fit(path, fit)
+
+
+def cached_unit_embedding(
+    source: pd.DataFrame,
+    scaler: StandardScaler,
+    feature_cols: list[str],
+    weights: Mapping[str, float] | None,
+    n_components: int,
+) -> np.ndarray | None:
+    """
+    Return the L2-normalized PCA embedding of every ``source`` row as
+    EMBEDDING_DTYPE, memory-mapped from the cache, or None when ``source`` is
+    not cacheable.
+
+    Rows with a zero projection stay zero, so cosine similarity against a
+    unit query is a single matrix-vector product over the selected rows.
+    """
+    validated = validate_feature_weights(weights) if weights is not None else None
+    path = _artifact_path(
+        source,
+        "catalog_pca_unit",
+        {
+            **_pca_payload(feature_cols, validated, n_components),
+            "dtype": np.dtype(EMBEDDING_DTYPE).name,
+        },
+        suffix=".npy",
+    )
+    if path is None:
+        return None
+
+    def fit() -> np.ndarray:
+        pca = cached_pca(source, scaler, feature_cols, validated, n_components)
+        w = weight_vector(validated, feature_cols) if validated is not None else None
+        W, offset = weighted_projection(pca, w)
+        embedding = _scaled_source(source, scaler, feature_cols) @ W
+        embedding += offset
+        norms = np.linalg.norm(embedding, axis=1, keepdims=True)
+        np.divide(embedding, norms, out=embedding, where=norms != 0)
+        return embedding.astype(EMBEDDING_DTYPE)
+
+    return _load_or_fit(path, fit, load=_load_memmap, dump=_save_array)
@@ -53,3 +53,32 @@ def transform_pca(X: np.ndarray, pca: PCA) -> np.ndarray:
     if X.ndim != 2:
         raise ValueError(f"X must be 2D (n_samples, n_features); got shape {X.shape}")
     return pca.transform(X)
+
+
+def weighted_projection(
+    pca: PCA, weights: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Fold feature weights and PCA centering into one affine projection.
+
+    Parameters
+    ----------
+    pca : PCA
+        Fitted PCA object from fit_pca.
+    weights : np.ndarray, shape (n_features,), optional
+        Per-feature multipliers applied before projection.
+
+    Returns
+    -------
+    tuple of np.ndarray
+        ``(W, offset)`` with shapes (n_features, n_components) and
+        (n_components,), such that ``X @ W + offset`` equals
+        ``transform_pca(X * weights, pca)``.
+    """
+    components = pca.components_
+    if pca.whiten:
+        components = components / np.sqrt(pca.explained_variance_)[:, None]
+    offset = -(pca.mean_ @ components.T)
+    if weights is not None:
+        components = components * weights[None, :]
+    return components.T.astype(np.float32), offset.astype(np.float32)
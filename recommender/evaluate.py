@@ -357,7 +357,8 @@ def _load_seed_tracks(catalog, spotify_ids: Sequence[str]) -> pd.DataFrame:
     else:
         seeds = catalog[catalog["spotify_id"].isin(spotify_ids)].copy()
         order = {track_id: index for index, track_id in enumerate(spotify_ids)}
-        seeds["_seed_order"] = seeds["spotify_id"].map(order)
+        # Mapping a categorical returns a categorical, which sorts by category code.
+        seeds["_seed_order"] = seeds["spotify_id"].astype(object).map(order)
         seeds = seeds.sort_values("_seed_order").drop(columns="_seed_order")
 
     loaded_ids = set(seeds["spotify_id"].dropna().astype(str))
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
-
 import numpy as np
 import pandas as pd
 from sklearn.preprocessing import StandardScaler
@@ -21,76 +19,75 @@ def _resolve_duration_column(df: pd.DataFrame) -> str:
     return "duration_ms"
 
 
-def _coerce_numeric(df: pd.DataFrame, cols: Iterable[str]) -> pd.DataFrame:
-    out = df.copy()
-    for c in cols:
-        if c in out.columns:
-            out[c] = pd.to_numeric(out[c], errors="coerce")
-    return out
+def _feature_values(df: pd.DataFrame, feature: str) -> np.ndarray:
+    """Coerce one source column to float32, creating the 'duration' surrogate."""
+    if feature == "duration_ms" and _resolve_duration_column(df) == "duration":
+        # create a duration_ms surrogate (assume 'duration' is in seconds)
+        values = pd.to_numeric(df["duration"], errors="coerce") * 1000.0
+    else:
+        values = pd.to_numeric(df[feature], errors="coerce")
+    return values.to_numpy(dtype=np.float32, na_value=np.nan)
+
+
+def _clip_column(column: np.ndarray, feature: str) -> None:
+    lo, hi = schema.CLIP_BOUNDS.get(feature, (None, None))
+    if lo is not None or hi is not None:
+        np.clip(column, lo, hi, out=column)
 
 
-def _apply_special_transforms(df: pd.DataFrame, feature_order: list[str]) -> pd.DataFrame:
+def _apply_special_transforms(X: np.ndarray, feature_order: list[str]) -> None:
     """
-    Apply mild, interpretable transforms to reduce skew:
-      - tempo: log1p
-      - duration_ms: convert to minutes then log1p
-    Handles 'duration' fallback automatically.
+    Apply mild, interpretable transforms to reduce skew, in place:
+      - tempo: clip, then log1p
+      - duration_ms: clip, convert to minutes, then log1p
+      - loudness: clip (dBFS)
     """
-    out = df.copy()
+    col_idx = {name: i for i, name in enumerate(feature_order)}
 
-    # handle duration column name
-    dur_col = _resolve_duration_column(out)
-    if dur_col != "duration_ms" and dur_col in out.columns and "duration_ms" in feature_order:
-        # create a duration_ms surrogate (assume 'duration' is in seconds)
-        out["duration_ms"] = out[dur_col] * 1000.0
-
-    # tempo
-    if "tempo" in out.columns and "tempo" in feature_order:
-        # clip first (optional), then log1p
-        lo, hi = schema.CLIP_BOUNDS.get("tempo", (None, None))
-        if lo is not None:
-            out["tempo"] = np.maximum(out["tempo"], lo)
-        if hi is not None:
-            out["tempo"] = np.minimum(out["tempo"], hi)
-        out["tempo"] = np.log1p(out["tempo"].clip(lower=0.0))
-
-    # duration_ms -> minutes then log1p
-    if "duration_ms" in out.columns and "duration_ms" in feature_order:
-        lo, hi = schema.CLIP_BOUNDS.get("duration_ms", (None, None))
-        if lo is not None:
-            out["duration_ms"] = np.maximum(out["duration_ms"], lo)
-        if hi is not None:
-            out["duration_ms"] = np.minimum(out["duration_ms"], hi)
-        # convert ms -> minutes
-        dur_min = out["duration_ms"] / 60000.0
-        out["duration_ms"] = np.log1p(dur_min.clip(lower=0.0))
+    if "tempo" in col_idx:
+        tempo = X[:, col_idx["tempo"]]
+        _clip_column(tempo, "tempo")
+        np.maximum(tempo, 0.0, out=tempo)
+        np.log1p(tempo, out=tempo)
 
-    # loudness clipping (dBFS)
-    if "loudness" in out.columns and "loudness" in feature_order:
-        lo, hi = schema.CLIP_BOUNDS.get("loudness", (None, None))
-        if lo is not None:
-            out["loudness"] = np.maximum(out["loudness"], lo)
-        if hi is not None:
-            out["loudness"] = np.minimum(out["loudness"], hi)
+    if "duration_ms" in col_idx:
+        duration = X[:, col_idx["duration_ms"]]
+        _clip_column(duration, "duration_ms")
+        # convert ms -> minutes
+        np.divide(duration, 60000.0, out=duration)
+        np.maximum(duration, 0.0, out=duration)
+        np.log1p(duration, out=duration)
 
-    return out
+    if "loudness" in col_idx:
+        _clip_column(X[:, col_idx["loudness"]], "loudness")
 
 
-def _extract_feature_matrix(df: pd.DataFrame, feature_order: list[str]) -> pd.DataFrame:
+def _extract_feature_matrix(df: pd.DataFrame, feature_order: list[str]) -> np.ndarray:
     """
-    Return a DataFrame with only the requested features, in the exact order.
+    Return a float32 matrix with only the requested features, in the exact order,
+    after clipping/log transforms. Missing values are left as NaN.
     Will create 'duration_ms' surrogate if only 'duration' exists.
     """
-    # ensure duration fallbacks are handled BEFORE selecting columns
-    df2 = _apply_special_transforms(
-        _coerce_numeric(df, [*feature_order, "duration"]), feature_order
-    )
-
-    missing = [c for c in feature_order if c not in df2.columns]
+    missing = [
+        c
+        for c in feature_order
+        if c not in df.columns
+        and not (c == "duration_ms" and _resolve_duration_column(df) == "duration")
+    ]
     if missing:
         raise KeyError(f"Missing required feature columns: {missing}")
 
-    return df2[feature_order].copy()
+    # Column-major so each per-feature transform scans contiguous memory.
+    X = np.empty((len(df), len(feature_order)), dtype=np.float32, order="F")
+    for i, feature in enumerate(feature_order):
+        X[:, i] = _feature_values(df, feature)
+    _apply_special_transforms(X, feature_order)
+    return X
+
+
+def _impute(X: np.ndarray, impute_values: np.ndarray) -> np.ndarray:
+    np.copyto(X, np.broadcast_to(impute_values, X.shape), where=np.isnan(X))
+    return X
 
 
 def fit_scaler(df: pd.DataFrame, feature_cols: list[str] | None = None) -> StandardScaler:
@@ -110,16 +107,19 @@ def fit_scaler(df: pd.DataFrame, feature_cols: list[str] | None = None) -> Stand
         Fitted scaler to be re-used for user seeds and candidates.
     """
     feats = feature_cols or schema.FEATURE_COLS
-    Xdf = _extract_feature_matrix(df, feats)
+    X = _extract_feature_matrix(df, feats)
 
     # Median-impute from the training/catalog distribution and retain those
     # values so user tracks and candidates are transformed consistently.
-    impute_values = Xdf.median(numeric_only=True).reindex(feats).fillna(0.0)
-    Xdf = Xdf.fillna(impute_values)
+    impute_values = pd.DataFrame(X, columns=feats, copy=False).median().fillna(0.0)
+    impute_values = impute_values.astype(np.float32)
+    X = _impute(X, impute_values.to_numpy())
 
     scaler = StandardScaler()
-    scaler.fit(Xdf.values.astype(np.float32))
-    scaler.impute_values_ = impute_values.astype(np.float32)
+    scaler.fit(X)
+    scaler.impute_values_ = impute_values
+    # Plain array copy for transform's hot path; impute_values_ keeps the labels.
+    scaler.feature_medians_ = impute_values.to_numpy(dtype=np.float32)
     scaler.impute_feature_cols_ = list(feats)
     return scaler
 
@@ -136,17 +136,21 @@ def transform(
     - Uses median imputation learned by fit_scaler from the catalog/training df.
     """
     feats = feature_cols or schema.FEATURE_COLS
-    Xdf = _extract_feature_matrix(df, feats)
+    X = _extract_feature_matrix(df, feats)
     if hasattr(scaler, "impute_values_"):
         if getattr(scaler, "impute_feature_cols_", list(feats)) != list(feats):
             raise ValueError("feature_cols must match the columns used to fit the scaler.")
-        impute_values = pd.Series(scaler.impute_values_, index=feats)
+        impute_values = getattr(scaler, "feature_medians_", None)
+        if impute_values is None:
+            # Scalers persisted before feature_medians_ existed.
+            impute_values = np.asarray(scaler.impute_values_, dtype=np.float32)
     else:
         # Backward compatibility for callers with an older persisted scaler.
-        impute_values = Xdf.median(numeric_only=True).reindex(feats).fillna(0.0)
-    Xdf = Xdf.fillna(impute_values)
+        medians = pd.DataFrame(X, columns=feats, copy=False).median().fillna(0.0)
+        impute_values = medians.to_numpy(dtype=np.float32)
+    X = _impute(X, impute_values)
 
-    X = scaler.transform(Xdf.values.astype(np.float32))
+    X = np.asarray(scaler.transform(X), dtype=np.float32)
     # ensure finite
-    X = np.where(np.isfinite(X), X, 0.0)
-    return X.astype(np.float32)
+    X[~np.isfinite(X)] = 0.0
+    return X
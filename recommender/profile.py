@@ -28,13 +28,19 @@ def build_user_profile(
         raise ValueError("User feature matrix is empty, cannot build profile.")
     if X_user.ndim != 2:
         raise ValueError("User feature matrix must be a two-dimensional array.")
-    if np.any(np.isinf(X_user)) or np.any(np.all(np.isnan(X_user), axis=0)):
+    observed = ~np.isnan(X_user)
+    if np.any(np.isinf(X_user)) or not np.all(observed.any(axis=0)):
         raise ValueError("User profile must contain only finite values.")
+    # preprocess.transform never emits NaN, so the NaN-aware paths are rare.
+    complete = bool(observed.all())
 
     if method == "mean":
-        profile = np.nanmean(X_user, axis=0)
+        if complete:
+            profile = X_user.mean(axis=0)
+        else:
+            profile = np.where(observed, X_user, 0.0).sum(axis=0) / observed.sum(axis=0)
     elif method == "median":
-        profile = np.nanmedian(X_user, axis=0)
+        profile = np.median(X_user, axis=0) if complete else np.nanmedian(X_user, axis=0)
     else:
         raise ValueError(f"Unknown method: {method}")
 
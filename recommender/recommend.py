@@ -5,15 +5,22 @@ from dataclasses import dataclass
 import numpy as np
 import pandas as pd
 
+from recommender.artifacts import (
+    cached_pca,
+    cached_scaled_features,
+    cached_scaler,
+    cached_unit_embedding,
+)
+from recommender.cluster import weighted_projection
 from recommender.explain import explain_feature_similarity
 from recommender.policy import RecommendationStrategy
-from recommender.preprocess import fit_scaler, transform
+from recommender.preprocess import transform
 from recommender.profile import build_user_profile
-from recommender.retrieve import filter_candidates
+from recommender.retrieve import candidate_mask
 from recommender.schema import FEATURE_COLS
-from recommender.similarity import cosine
+from recommender.similarity import cosine, cosine_unit
 from recommender.steering import rerank_with_adjustments
-from recommender.weightings import apply_weights
+from recommender.weightings import weight_vector
 from utils.matcher import canon_artist_primary
 from utils.merge_datasets import get_merged_dataset
 
@@ -25,12 +32,29 @@ class PreparedCandidates:
     candidates: pd.DataFrame
     scaler_source: pd.DataFrame
     min_popularity: int | None
+    # Row positions of ``candidates`` within ``scaler_source``, when known.
+    candidate_positions: np.ndarray | None = None
 
     @property
     def candidate_pool_size(self) -> int:
         return len(self.candidates)
 
 
+def _top_positions(scores, k: int) -> np.ndarray:
+    """Positions of the ``k`` highest scores, best first, without a full sort."""
+    negated = -np.asarray(scores, dtype=np.float64)
+    k = min(k, len(negated))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < len(negated):
+        top = np.argpartition(negated, k - 1)[:k]
+        # Sorting positions first makes ties keep catalog order, as a stable sort would.
+        top.sort()
+    else:
+        top = np.arange(len(negated))
+    return top[np.argsort(negated[top], kind="stable")]
+
+
 def _sample_from_top_candidates(ranked, top_n, random_state=None):
     """Select a relevance-weighted subset while preserving score order."""
     result_size = min(top_n, len(ranked))
@@ -75,26 +99,29 @@ def prepare_recommendation_candidates(
 
     def load_candidates(candidate_min_popularity):
         if hasattr(catalog, "load_candidates"):
-            return catalog.load_candidates(
+            loaded = catalog.load_candidates(
                 exclude_ids=exclude_ids,
                 exclude_artists=exclude_artists,
                 min_popularity=candidate_min_popularity,
                 year_range=year_range,
             )
-        return filter_candidates(
+            return loaded, None
+        mask = candidate_mask(
             catalog,
             exclude_ids=exclude_ids,
             exclude_artists=exclude_artists,
             min_popularity=candidate_min_popularity,
             year_range=year_range,
         )
+        positions = np.flatnonzero(mask)
+        return catalog.iloc[positions].reset_index(drop=True), positions
 
     applied_min_popularity = min_popularity
-    candidates = load_candidates(min_popularity)
+    candidates, positions = load_candidates(min_popularity)
     if min_popularity is not None and len(candidates) < top_n:
         # If session memory or popularity filters leave too few candidates,
         # keep the no-repeat guarantee and widen quality constraints instead.
-        candidates = load_candidates(None)
+        candidates, positions = load_candidates(None)
         applied_min_popularity = None
 
     scaler_source = candidates if hasattr(catalog, "load_candidates") else catalog
@@ -102,6 +129,7 @@ def prepare_recommendation_candidates(
         candidates=candidates,
         scaler_source=scaler_source,
         min_popularity=applied_min_popularity,
+        candidate_positions=positions,
     )
 
 
@@ -140,10 +168,11 @@ def recommend_from_prepared_candidates(
         return _finalize_recommendations(empty, prepared)
 
     if strategy == "popularity":
-        recs = candidates.copy()
-        recs["score"] = recs["popularity"].fillna(0).astype(float)
+        popularity = candidates["popularity"].fillna(0).astype(float).to_numpy()
+        top = _top_positions(popularity, top_n)
+        recs = candidates.iloc[top].copy()
+        recs["score"] = popularity[top]
         recs["similarity"] = recs["score"]
-        recs = recs.sort_values("score", ascending=False).head(top_n)
         return _finalize_recommendations(recs, prepared)
 
     if strategy == "random":
@@ -156,55 +185,71 @@ def recommend_from_prepared_candidates(
         raise ValueError(f"Unknown recommendation strategy: {strategy}")
 
     scaler_source = prepared.scaler_source
-    scaler = fit_scaler(scaler_source, FEATURE_COLS)
+    scaler = cached_scaler(scaler_source, FEATURE_COLS)
     X_user = transform(user_tracks_df, scaler, FEATURE_COLS)
     u_vec = build_user_profile(X_user, method="median")
-    X_cands = transform(candidates, scaler, FEATURE_COLS)
-    candidates = candidates.copy()
-    candidates["recommendation_reason"] = explain_feature_similarity(
-        u_vec,
-        X_cands,
-        FEATURE_COLS,
-    )
 
     weights = user_weights if strategy == "weighted_cosine" else None
-
-    if weights is not None:
-        u_vec = apply_weights(u_vec, weights, FEATURE_COLS)
-
-    if weights is not None:
-        X_cands = apply_weights(X_cands, weights, FEATURE_COLS)
+    w = weight_vector(weights, FEATURE_COLS) if weights is not None else None
 
     # === PCA dimensionality reduction ===
+    embedding = None
+    scaled = None
     if use_pca:
-        from recommender.cluster import fit_pca, transform_pca
-
-        # Fit PCA on the in-memory catalog or bounded store sample.
-        X_catalog = transform(scaler_source, scaler, FEATURE_COLS)
-        if weights is not None:
-            X_catalog = apply_weights(X_catalog, weights, FEATURE_COLS)
-
-        pca = fit_pca(X_catalog, n_components=pca_components)
-
-        # transform everything into PCA space
-        X_cands = transform_pca(X_cands, pca)
-        u_vec = transform_pca(u_vec.reshape(1, -1), pca).reshape(-1)
+        # Fit PCA on the in-memory catalog or bounded store sample; fits on a
+        # cached merged dataset are reused across calls.
+        pca = cached_pca(scaler_source, scaler, FEATURE_COLS, weights, pca_components)
+
+        # Weighting and projection collapse into a single matmul per matrix.
+        W, offset = weighted_projection(pca, w)
+        u_query = u_vec @ W + offset
+        if prepared.candidate_positions is not None:
+            embedding = cached_unit_embedding(
+                scaler_source, scaler, FEATURE_COLS, weights, pca_components
+            )
+    else:
+        u_query = u_vec * w if w is not None else u_vec
+        if prepared.candidate_positions is not None:
+            scaled = cached_scaled_features(scaler_source, scaler, FEATURE_COLS)
+
+    if embedding is not None:
+        # Cached catalogs keep prenormalized PCA rows, so candidates are scored
+        # without being transformed at all.
+        sims = cosine_unit(u_query, embedding[prepared.candidate_positions])
+    else:
+        X_cands = (
+            scaled[prepared.candidate_positions]
+            if scaled is not None
+            else transform(candidates, scaler, FEATURE_COLS)
+        )
+        if use_pca:
+            X_cands = X_cands @ W
+            X_cands += offset
+        elif w is not None:
+            X_cands *= w
+        sims = cosine(u_query, X_cands)
 
-    sims = cosine(u_vec, X_cands)
-    candidates["similarity"] = sims
     scores, targets = rerank_with_adjustments(
         candidates,
         user_tracks_df,
         sims,
         adjustments,
     )
-    candidates["score"] = scores
-    candidates.attrs["steering_targets"] = targets
-    ranked = candidates.sort_values("score", ascending=False)
+    # _sample_from_top_candidates draws from the best 3 * top_n rows.
+    top = _top_positions(scores, top_n * 3 if randomize_results else top_n)
+    recs = candidates.iloc[top].copy()
+    recs["similarity"] = sims[top]
+    recs["score"] = scores[top]
     if randomize_results:
-        recs = _sample_from_top_candidates(ranked, top_n, random_state)
-    else:
-        recs = ranked.head(top_n)
+        recs = _sample_from_top_candidates(recs, top_n, random_state)
+
+    # Explanations compare unweighted scaled features, and only for the rows returned.
+    reasons = (
+        explain_feature_similarity(u_vec, transform(recs, scaler, FEATURE_COLS), FEATURE_COLS)
+        if len(recs)
+        else []
+    )
+    recs.insert(len(candidates.columns), "recommendation_reason", reasons)
     return _finalize_recommendations(recs, prepared, steering_targets=targets)
 
 
@@ -263,7 +308,16 @@ def recommend(
     adjustments=None,
     exclude_spotify_ids=None,
 ):
-    catalog = get_merged_dataset(catalog_paths)
+    """
+    Recommend from the merged dataset of ``catalog_paths``.
+
+    ``catalog_paths`` may also be an already loaded catalog (a DataFrame or a
+    catalog store), which skips reloading the merged dataset.
+    """
+    if isinstance(catalog_paths, pd.DataFrame) or hasattr(catalog_paths, "load_candidates"):
+        catalog = catalog_paths
+    else:
+        catalog = get_merged_dataset(catalog_paths)
     return recommend_from_catalog(
         catalog=catalog,
         user_tracks_df=user_tracks_df,
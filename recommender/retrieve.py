@@ -1,39 +1,75 @@
 from collections.abc import Iterable
 
+import numpy as np
 import pandas as pd
 
 from utils.matcher import canon_artist_primary
 
 
-def filter_candidates(
+def _as_mask(condition: pd.Series) -> np.ndarray:
+    return condition.to_numpy(dtype=bool, na_value=False)
+
+
+def _id_mask(ids: pd.Series, exclude_ids: Iterable[str]) -> np.ndarray:
+    exclude = pd.Index(list(exclude_ids))
+    values = ids.array
+    if isinstance(values, pd.Categorical):
+        # Match on the integer category codes rather than hashing every string.
+        codes = values.categories.get_indexer(exclude)
+        return np.isin(values.codes, codes[codes >= 0])
+    return np.asarray(ids.isin(exclude), dtype=bool)
+
+
+def candidate_mask(
     catalog: pd.DataFrame,
     exclude_ids: Iterable[str] | None = None,
     exclude_artists: Iterable[str] | None = None,
     min_popularity: int | None = None,
     max_popularity: int | None = None,
     year_range: tuple[int, int] | None = None,
-) -> pd.DataFrame:
-    df = catalog.copy()
+) -> np.ndarray:
+    """Return a boolean array marking catalog rows that pass every filter."""
+    mask = np.ones(len(catalog), dtype=bool)
 
     if exclude_ids is not None:
-        df = df[~df["spotify_id"].isin(set(exclude_ids))]
+        mask &= ~_id_mask(catalog["spotify_id"], exclude_ids)
 
     if exclude_artists is not None:
         artist_set = {artist for artist in exclude_artists if artist}
         if artist_set:
-            if "artist_primary_canon" in df.columns:
-                candidate_artists = df["artist_primary_canon"]
+            if "artist_primary_canon" in catalog.columns:
+                candidate_artists = catalog["artist_primary_canon"]
             else:
-                candidate_artists = df["artists_raw"].apply(canon_artist_primary)
-            df = df[~candidate_artists.isin(artist_set)]
+                candidate_artists = catalog["artists_raw"].apply(canon_artist_primary)
+            mask &= ~_as_mask(candidate_artists.isin(artist_set))
 
     if min_popularity is not None:
-        df = df[df["popularity"].fillna(0) >= min_popularity]
+        mask &= _as_mask(catalog["popularity"].fillna(0) >= min_popularity)
     if max_popularity is not None:
-        df = df[df["popularity"].fillna(100) <= max_popularity]
+        mask &= _as_mask(catalog["popularity"].fillna(100) <= max_popularity)
 
     if year_range is not None:
         lo, hi = year_range
-        df = df[df["release_year"].between(lo, hi, inclusive="both")]
+        mask &= _as_mask(catalog["release_year"].between(lo, hi, inclusive="both"))
+
+    return mask
+
 
-    return df.reset_index(drop=True)
+def filter_candidates(
+    catalog: pd.DataFrame,
+    exclude_ids: Iterable[str] | None = None,
+    exclude_artists: Iterable[str] | None = None,
+    min_popularity: int | None = None,
+    max_popularity: int | None = None,
+    year_range: tuple[int, int] | None = None,
+) -> pd.DataFrame:
+    mask = candidate_mask(
+        catalog,
+        exclude_ids=exclude_ids,
+        exclude_artists=exclude_artists,
+        min_popularity=min_popularity,
+        max_popularity=max_popularity,
+        year_range=year_range,
+    )
+    # One combined mask means a single copy of the surviving rows.
+    return catalog.iloc[mask].reset_index(drop=True)
@@ -3,7 +3,7 @@
 import numpy as np
 
 
-def cosine(u: np.ndarray, V: np.ndarray) -> np.ndarray:
+def cosine(u: np.ndarray, V: np.ndarray, V_norms: np.ndarray | None = None) -> np.ndarray:
     """
     Compute cosine similarity between vector u and each row of V.
 
@@ -13,6 +13,9 @@ def cosine(u: np.ndarray, V: np.ndarray) -> np.ndarray:
         Single vector.
     V : np.ndarray, shape (n, d)
         Matrix of candidate vectors.
+    V_norms : np.ndarray, shape (n,), optional
+        Precomputed L2 norms of the rows of V, for callers that score the
+        same matrix repeatedly.
 
     Returns
     -------
@@ -31,19 +34,33 @@ def cosine(u: np.ndarray, V: np.ndarray) -> np.ndarray:
     if u_norm == 0:
         return np.zeros(V.shape[0], dtype=np.float32)
 
-    # normalize rows of V
-    V_norms = np.linalg.norm(V, axis=1)
-    safe_V = np.zeros_like(V, dtype=np.result_type(V.dtype, np.float32))
-    np.divide(
-        V,
-        V_norms[:, None],
-        out=safe_V,
-        where=V_norms[:, None] != 0,
-    )
-
-    # normalize u once
-    u_unit = u / u_norm
-
-    # dot product = cosine similarity
-    sims = safe_V @ u_unit
-    return sims.astype(np.float32)
+    u_unit = (u / u_norm).astype(np.result_type(V.dtype, np.float32), copy=False)
+
+    # Divide the n dot products by the row norms instead of materializing a
+    # normalized copy of V; zero rows already have a zero dot product.
+    sims = V @ u_unit
+    if V_norms is None:
+        V_norms = np.linalg.norm(V, axis=1)
+    np.divide(sims, V_norms, out=sims, where=V_norms != 0)
+    return sims.astype(np.float32, copy=False)
+
+
+def cosine_unit(u: np.ndarray, V_unit: np.ndarray) -> np.ndarray:
+    """
+    Cosine similarity against rows that are already unit length (or zero).
+
+    Equivalent to ``cosine(u, V)`` for the unnormalized V, without touching
+    row norms. Half-precision rows are upcast to float32 before the product.
+    """
+    if u.ndim != 1:
+        raise ValueError("Input u must be a 1D vector.")
+    if V_unit.ndim != 2 or V_unit.shape[1] != u.shape[0]:
+        raise ValueError("Input u and rows of V_unit must have the same number of features.")
+
+    u_norm = np.linalg.norm(u)
+    if u_norm == 0:
+        return np.zeros(V_unit.shape[0], dtype=np.float32)
+    # NumPy has no BLAS kernel for float16, so only storage stays half precision.
+    dtype = np.result_type(V_unit.dtype, np.float32)
+    sims = V_unit.astype(dtype, copy=False) @ (u / u_norm).astype(dtype, copy=False)
+    return sims.astype(np.float32, copy=False)
@@ -42,6 +42,23 @@ def validate_feature_weights(weights: Mapping[str, float]) -> dict[str, float]:
     return validated
 
 
+def weight_vector(weights: Mapping[str, float], feature_order: Sequence[str]) -> np.ndarray:
+    """
+    Return float32 multipliers aligned with ``feature_order``.
+
+    Features missing from ``weights`` get weight 1.0.
+    """
+    features = tuple(feature_order)
+    if len(features) != len(set(features)):
+        raise ValueError("feature_order must not contain duplicate features.")
+    unknown_features = set(features) - _SUPPORTED_FEATURES
+    if unknown_features:
+        raise ValueError(f"Unsupported features in feature_order: {sorted(unknown_features)}")
+
+    validated_weights = validate_feature_weights(weights)
+    return np.array([validated_weights.get(feature, 1.0) for feature in features], dtype=np.float32)
+
+
 def apply_weights(
     X: np.ndarray,
     weights: Mapping[str, float],
@@ -68,23 +85,13 @@ def apply_weights(
     if X.ndim not in {1, 2}:
         raise ValueError("X must be a 1D or 2D numpy array.")
 
-    features = tuple(feature_order)
-    if len(features) != len(set(features)):
-        raise ValueError("feature_order must not contain duplicate features.")
-    unknown_features = set(features) - _SUPPORTED_FEATURES
-    if unknown_features:
-        raise ValueError(f"Unsupported features in feature_order: {sorted(unknown_features)}")
-
+    w = weight_vector(weights, feature_order)
     feature_count = X.shape[0] if X.ndim == 1 else X.shape[1]
-    if feature_count != len(features):
+    if feature_count != len(w):
         raise ValueError(
             "The feature dimension of X must match the number of entries in feature_order."
         )
 
-    validated_weights = validate_feature_weights(weights)
-    # Build a weight vector aligned with feature_order.
-    w = np.array([validated_weights.get(feature, 1.0) for feature in features], dtype=np.float32)
-
     if X.ndim == 1:  # single vector
         return X * w
     return X * w[None, :]
@@ -15,7 +15,7 @@ if str(ROOT_DIR) not in sys.path:
 
 from utils.catalog_store import CatalogStore
 from utils.matcher import build_indexes
-from utils.merge_datasets import get_merged_dataset
+from utils.merge_datasets import get_catalog_indexes, get_merged_dataset
 from utils.spotify_auth import (
     DEFAULT_EVALUATION_TOKEN_CACHE,
     get_cached_user_spotify_client,
@@ -111,13 +111,17 @@ def build_evaluation_dataset(
     raw_catalog_rows: int | None = None,
     catalog_store=None,
     catalog_rows: int | None = None,
+    indexes: dict | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     if catalog_store is None and catalog_df is None:
         raise ValueError("Provide catalog_store or catalog_df.")
     if not playlist_inputs:
         return pd.DataFrame(), pd.DataFrame()
 
-    indexes = build_indexes(catalog_df) if catalog_store is None else None
+    if catalog_store is not None:
+        indexes = None
+    elif indexes is None:
+        indexes = build_indexes(catalog_df)
     playlist_frames = []
     summary_rows = []
     merged_catalog_rows = catalog_rows
@@ -289,11 +293,18 @@ def main() -> None:
     catalog_store = None
     catalog_rows = None
     raw_catalog_rows = None
+    indexes = None
     if args.raw_catalog_path:
         catalog_paths = args.raw_catalog_path
         catalog_df = get_merged_dataset(
             catalog_paths,
             force_rebuild=args.force_rebuild_catalog,
+            parallel=True,
+        )
+        indexes = get_catalog_indexes(
+            catalog_df,
+            force_rebuild=args.force_rebuild_catalog,
+            parallel=True,
         )
         raw_catalog_rows = count_raw_catalog_rows(catalog_paths)
         catalog_rows = len(catalog_df)
@@ -317,6 +328,7 @@ def main() -> None:
         min_matched_tracks=args.min_matched_tracks,
         raw_catalog_rows=raw_catalog_rows,
         catalog_rows=catalog_rows,
+        indexes=indexes,
     )
     if dataset.empty:
         if args.summary_csv and not summary.empty:
@@ -0,0 +1,24 @@
+import os
+
+import pytest
+
+from utils import matcher, merge_datasets
+
+
+@pytest.fixture
+def eager_parallelism(monkeypatch):
+    """Lower the worker thresholds so small inputs take the process-pool paths."""
+    monkeypatch.setattr(merge_datasets, "PARALLEL_NORMALIZE_MIN_ROWS", 0)
+    monkeypatch.setattr(matcher, "PARALLEL_CANON_MIN_VALUES", 2)
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+
+
+@pytest.fixture
+def no_process_pools(monkeypatch):
+    """Fail any attempt to start a worker process pool."""
+
+    def fail_pool(*args, **kwargs):
+        raise AssertionError("worker processes start only when parallel is set")
+
+    for module in (matcher, merge_datasets):
+        monkeypatch.setattr(module, "ProcessPoolExecutor", fail_pool)
@@ -0,0 +1,144 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from recommender import artifacts
+from recommender.artifacts import (
+    cached_pca,
+    cached_scaled_features,
+    cached_scaler,
+    cached_unit_embedding,
+)
+from recommender.preprocess import transform
+from recommender.schema import FEATURE_COLS
+from utils.merge_datasets import _register_catalog
+
+
+def _catalog(cache_dir, rows=4):
+    catalog = pd.DataFrame(
+        {
+            "danceability": np.linspace(0.1, 0.9, rows),
+            "energy": np.linspace(0.9, 0.1, rows),
+            "valence": 0.5,
+            "acousticness": np.linspace(0.0, 0.4, rows),
+            "instrumentalness": 0.0,
+            "liveness": 0.1,
+            "speechiness": 0.05,
+            "tempo": np.linspace(90.0, 150.0, rows),
+            "loudness": -8.0,
+            "duration_ms": 210_000,
+        }
+    )
+    _register_catalog(catalog, cache_dir)
+    return catalog
+
+
+def _fail(*args, **kwargs):
+    raise AssertionError("expected a cached artifact")
+
+
+def test_cached_scaler_reuses_fit_for_the_same_dataset(monkeypatch, tmp_path):
+    catalog = _catalog(tmp_path)
+
+    fitted = cached_scaler(catalog, FEATURE_COLS)
+    monkeypatch.setattr(artifacts, "fit_scaler", _fail)
+    cached = cached_scaler(catalog, FEATURE_COLS)
+
+    assert len(list(tmp_path.glob("scaler_*.joblib"))) == 1
+    np.testing.assert_allclose(cached.mean_, fitted.mean_)
+    assert list(cached.impute_values_.index) == FEATURE_COLS
+
+
+def test_cached_pca_is_keyed_by_weights_and_components(tmp_path):
+    catalog = _catalog(tmp_path)
+    scaler = cached_scaler(catalog, FEATURE_COLS)
+
+    cached_pca(catalog, scaler, FEATURE_COLS, None, 3)
+    cached_pca(catalog, scaler, FEATURE_COLS, {"energy": 2.0}, 3)
+    cached_pca(catalog, scaler, FEATURE_COLS, {"energy": 2.0}, 2)
+    cached_pca(catalog, scaler, FEATURE_COLS, {"energy": 2.0}, 2)
+
+    assert len(list(tmp_path.glob("pca_*.joblib"))) == 3
+
+
+@pytest.mark.parametrize("derived", ["subset", "reordered", "assigned", "copy"])
+def test_artifacts_are_not_cached_for_frames_derived_from_the_catalog(tmp_path, derived):
+    catalog = _catalog(tmp_path)
+    source = {
+        "subset": lambda: catalog.head(2),
+        "reordered": lambda: catalog.sample(frac=1.0, random_state=0),
+        "assigned": lambda: catalog.assign(energy=0.5),
+        "copy": lambda: catalog.copy(),
+    }[derived]()
+
+    cached_scaler(source, FEATURE_COLS)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_artifacts_are_keyed_by_catalog_content(tmp_path):
+    first = _catalog(tmp_path)
+    same = _catalog(tmp_path)
+    changed = _catalog(tmp_path)
+    changed["energy"] = 0.3
+    _register_catalog(changed, tmp_path)
+
+    for catalog in (first, same, changed):
+        cached_scaler(catalog, FEATURE_COLS)
+
+    assert len(list(tmp_path.glob("scaler_*.joblib"))) == 2
+    energy = FEATURE_COLS.index("energy")
+    np.testing.assert_allclose(cached_scaler(changed, FEATURE_COLS).mean_[energy], 0.3)
+
+
+def test_cached_unit_embedding_is_memory_mapped_and_normalized(tmp_path):
+    catalog = _catalog(tmp_path)
+    scaler = cached_scaler(catalog, FEATURE_COLS)
+
+    built = cached_unit_embedding(catalog, scaler, FEATURE_COLS, {"energy": 2.0}, 3)
+    cached = cached_unit_embedding(catalog, scaler, FEATURE_COLS, {"energy": 2.0}, 3)
+
+    assert len(list(tmp_path.glob("catalog_pca_unit_*.npy"))) == 1
+    assert isinstance(cached, np.memmap)
+    assert cached.dtype == np.float16
+    np.testing.assert_array_equal(cached, built)
+    norms = np.linalg.norm(cached.astype(np.float32), axis=1)
+    np.testing.assert_allclose(norms, 1.0, atol=1e-3)
+
+
+def test_cached_scaled_features_are_memory_mapped_float32(tmp_path):
+    catalog = _catalog(tmp_path)
+    scaler = cached_scaler(catalog, FEATURE_COLS)
+
+    cached_scaled_features(catalog, scaler, FEATURE_COLS)
+    cached = cached_scaled_features(catalog, scaler, FEATURE_COLS)
+
+    assert len(list(tmp_path.glob("catalog_scaled_*.npy"))) == 1
+    assert isinstance(cached, np.memmap)
+    assert cached.dtype == np.float32
+    np.testing.assert_array_equal(cached, transform(catalog, scaler, FEATURE_COLS))
+    assert cached_scaled_features(catalog.head(2), scaler, FEATURE_COLS) is None
+
+
+def test_cached_scaled_features_follow_the_catalog_rows_and_values(tmp_path):
+    catalog = _catalog(tmp_path)
+    scaler = cached_scaler(catalog, FEATURE_COLS)
+    cached_scaled_features(catalog, scaler, FEATURE_COLS)
+    rebuilt = _catalog(tmp_path)
+    rebuilt["tempo"] = rebuilt["tempo"].to_numpy()[::-1]
+    _register_catalog(rebuilt, tmp_path)
+
+    assert cached_scaled_features(catalog.iloc[::-1], scaler, FEATURE_COLS) is None
+    assert cached_scaled_features(catalog.assign(tempo=120.0), scaler, FEATURE_COLS) is None
+    np.testing.assert_array_equal(
+        cached_scaled_features(rebuilt, scaler, FEATURE_COLS),
+        transform(rebuilt, scaler, FEATURE_COLS),
+    )
+    assert len(list(tmp_path.glob("catalog_scaled_*.npy"))) == 2
+
+
+def test_cached_unit_embedding_requires_a_cacheable_source(tmp_path):
+    catalog = _catalog(tmp_path).head(2)
+    scaler = cached_scaler(catalog, FEATURE_COLS)
+
+    assert cached_unit_embedding(catalog, scaler, FEATURE_COLS, None, 3) is None
@@ -1,7 +1,7 @@
 import numpy as np
 import pytest
 
-from recommender.cluster import fit_pca, transform_pca
+from recommender.cluster import fit_pca, transform_pca, weighted_projection
 
 
 def test_fit_pca_caps_components_by_samples_and_features():
@@ -30,3 +30,14 @@ def test_fit_pca_rejects_invalid_inputs():
 
     with pytest.raises(ValueError, match="at least 1"):
         fit_pca(np.ones((3, 2)), n_components=0)
+
+
+def test_weighted_projection_matches_weighting_then_transform():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(20, 4)).astype(np.float32)
+    weights = np.array([2.0, 0.5, 1.0, 0.0], dtype=np.float32)
+    pca = fit_pca(X * weights, n_components=3)
+
+    W, offset = weighted_projection(pca, weights)
+
+    np.testing.assert_allclose(X @ W + offset, transform_pca(X * weights, pca), atol=1e-5)
@@ -6,6 +6,7 @@ from recommender.evaluate import (
     SUMMARY_METRICS,
     EvaluationConfig,
     EvaluationStrategy,
+    _load_seed_tracks,
     audit_memberships,
     bootstrap_confidence_intervals,
     evaluate_benchmark,
@@ -201,6 +202,15 @@ def test_unmatched_membership_reduces_end_to_end_recall_ceiling():
     assert row["recall_at_k"] <= row["matched_recall_ceiling"]
 
 
+def test_seed_tracks_keep_the_requested_order_in_a_categorical_catalog():
+    catalog = pd.DataFrame([_track("a", 0.1, 0.2), _track("b", 0.5, 0.5), _track("c", 0.9, 0.8)])
+    catalog["spotify_id"] = pd.Categorical(catalog["spotify_id"], categories=["c", "b", "a"])
+
+    seeds = _load_seed_tracks(catalog, ["b", "c", "a"])
+
+    assert seeds["spotify_id"].tolist() == ["b", "c", "a"]
+
+
 def test_repeated_splits_and_randomized_policy_are_reproducible():
     catalog = pd.DataFrame(
         [_track(f"track-{index}", 0.1 + index / 20, 0.2 + index / 20) for index in range(8)]
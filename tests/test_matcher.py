@@ -1,10 +1,18 @@
+import numpy as np
 import pandas as pd
+import pytest
 
+from utils import matcher
 from utils.matcher import (
     build_indexes,
     canon_artist_primary,
+    canon_artist_primary_series,
     canon_title,
+    canon_title_series,
+    load_indexes,
+    match_position,
     match_track,
+    save_indexes,
 )
 
 
@@ -20,6 +28,23 @@ def test_canon_artist_primary_handles_lists_and_stringified_lists():
     assert canon_artist_primary("Beyonce, JAY-Z") == "beyonce"
 
 
+def test_canon_artist_primary_reads_artist_arrays_from_parquet(tmp_path):
+    path = tmp_path / "artists.parquet"
+    pd.DataFrame({"artists_raw": [["Beyoncé", "JAY-Z"], []]}).to_parquet(path)
+    artists = pd.read_parquet(path)["artists_raw"]
+
+    assert [canon_artist_primary(value) for value in artists] == ["beyonce", ""]
+    assert canon_artist_primary_series(artists).tolist() == ["beyonce", ""]
+
+
+def test_stringified_artist_lists_parse_like_literal_eval():
+    assert canon_artist_primary("[\"Guns N' Roses\", 'Slash']") == "guns n' roses"
+    assert canon_artist_primary("['Sigur R\\u00f3s']") == "sigur ros"
+    assert canon_artist_primary("[]") == ""
+    # Unparseable or unhashable literals fall back to the comma split.
+    assert canon_artist_primary("[{['x']}]") == "[{['x']}]"
+
+
 def test_match_track_prefers_exact_spotify_id():
     df = pd.DataFrame(
         [
@@ -148,3 +173,206 @@ def test_match_track_breaks_ties_toward_canonical_version():
     match = match_track(spotify_track, indexes, df)
 
     assert match["spotify_id"] == "canonical"
+
+
+def test_build_indexes_groups_row_positions_by_canonical_key():
+    df = pd.DataFrame(
+        [
+            {"spotify_id": "a", "title_raw": "Song", "artists_raw": ["Artist"]},
+            {"spotify_id": None, "title_raw": "Song (Live)", "artists_raw": ["Artist"]},
+            {"spotify_id": "c", "title_raw": "Other", "artists_raw": ["Artist"]},
+            {"spotify_id": "d", "title_raw": "", "artists_raw": []},
+        ],
+        index=[7, 3, 5, 1],
+    )
+
+    indexes = build_indexes(df)
+
+    assert indexes["by_id"] == {"a": 0, "c": 2, "d": 3}
+    assert indexes["by_key"][("song", "artist")].tolist() == [0, 1]
+    assert indexes["by_key"][("other", "artist")].tolist() == [2]
+    assert indexes["by_artist"]["artist"].tolist() == [0, 1, 2]
+    assert "" not in indexes["by_artist"]
+
+
+def test_build_indexes_trusts_existing_canonical_columns(monkeypatch):
+    df = pd.DataFrame(
+        {
+            "title_raw": ["Song", "!!!"],
+            "artists_raw": [["Artist"], ["Artist"]],
+            "title_canon": ["song", ""],
+            "artist_primary_canon": ["artist", None],
+        }
+    )
+    monkeypatch.setattr(matcher, "_canonicalize_all", lambda *args: pytest.fail("recomputed"))
+
+    indexes = build_indexes(df)
+
+    assert list(indexes["by_key"]) == [("song", "artist")]
+    assert indexes["by_artist"]["artist"].tolist() == [0]
+
+
+def test_match_track_ranks_candidates_from_index_arrays():
+    df = pd.DataFrame(
+        [
+            {
+                "spotify_id": "no-duration",
+                "title_raw": "Song",
+                "artists_raw": ["Artist"],
+                "duration_ms": None,
+                "popularity": 99,
+                "release_year": 2024,
+            },
+            {
+                "spotify_id": "older",
+                "title_raw": "Song",
+                "artists_raw": ["Artist"],
+                "duration_ms": 200_000,
+                "popularity": 50,
+                "release_year": 1999,
+            },
+            {
+                "spotify_id": "newer",
+                "title_raw": "Song",
+                "artists_raw": ["Artist"],
+                "duration_ms": 201_000,
+                "popularity": 50,
+                "release_year": 2005,
+            },
+        ]
+    )
+    indexes = build_indexes(df)
+    spotify_track = {
+        "name": "Song",
+        "artists": [{"name": "Artist"}],
+        "duration_ms": 200_500,
+    }
+
+    match = match_track(spotify_track, indexes, df)
+
+    assert indexes["by_key"][("song", "artist")].dtype == np.int32
+    assert match["spotify_id"] == "newer"
+
+
+def test_match_position_resolves_rows_without_the_dataframe():
+    df = pd.DataFrame(
+        {
+            "spotify_id": ["a", "b"],
+            "title_raw": ["Song", "Other"],
+            "artists_raw": [["Artist"], ["Artist"]],
+            "duration_ms": [200_000, 180_000],
+            "popularity": [10, 20],
+        },
+        index=[7, 3],
+    )
+    indexes = build_indexes(df)
+
+    assert match_position({"id": "b"}, indexes) == 1
+    assert match_position({"name": "Song", "artists": [{"name": "Artist"}]}, indexes) == 0
+    assert match_position({"name": "Missing", "artists": []}, indexes) is None
+    assert match_track({"id": "b"}, indexes, df) == df.iloc[1].to_dict()
+
+
+def test_saved_indexes_round_trip_without_pickle(tmp_path):
+    df = pd.DataFrame(
+        [
+            {
+                "spotify_id": "a",
+                "title_raw": "Café",
+                "artists_raw": ["Björk"],
+                "duration_ms": 200_000,
+                "popularity": 10,
+            },
+            {
+                "spotify_id": "b",
+                "title_raw": "Cafe (Live)",
+                "artists_raw": ["Bjork"],
+                "duration_ms": None,
+                "popularity": 20,
+            },
+        ]
+    )
+    indexes = build_indexes(df)
+    path = tmp_path / "indexes.npz"
+
+    save_indexes(indexes, path)
+    loaded = load_indexes(path)
+
+    assert loaded["by_id"] == indexes["by_id"]
+    assert loaded["by_key"].keys() == indexes["by_key"].keys()
+    assert loaded["by_key"][("cafe", "bjork")].tolist() == [0, 1]
+    assert loaded["by_artist"]["bjork"].tolist() == [0, 1]
+    np.testing.assert_array_equal(loaded["duration_ms"], indexes["duration_ms"])
+    # The live version ranks behind the canonical title despite its popularity.
+    assert loaded["match_rank"].tolist() == [0, 1]
+    # Loaded artist keys share one string object across both indexes.
+    [(_, key_artist)] = loaded["by_key"]
+    [artist_key] = loaded["by_artist"]
+    assert key_artist is artist_key
+
+
+def _uncanonicalized_catalog():
+    return pd.DataFrame(
+        {
+            "spotify_id": [f"id-{i}" for i in range(8)],
+            "title_raw": ["Song (Live)", "Café - Radio Edit", None, "Plain"] * 2,
+            "artists_raw": [["Björk"], "['A', 'B']", "C, D", None] * 2,
+            "duration_ms": 200_000,
+        }
+    )
+
+
+def test_parallel_index_build_matches_the_serial_build(eager_parallelism):
+    catalog = _uncanonicalized_catalog()
+
+    parallel = build_indexes(catalog, parallel=True)
+    serial = build_indexes(catalog)
+
+    assert parallel["by_id"] == serial["by_id"]
+    for name in ("by_key", "by_artist"):
+        assert {key: value.tolist() for key, value in parallel[name].items()} == {
+            key: value.tolist() for key, value in serial[name].items()
+        }
+    np.testing.assert_array_equal(parallel["match_rank"], serial["match_rank"])
+
+
+def test_index_build_starts_no_workers_unless_parallel(eager_parallelism, no_process_pools):
+    indexes = build_indexes(_uncanonicalized_catalog())
+
+    assert indexes["by_key"][("cafe", "a")].tolist() == [1, 5]
+
+
+def test_series_canonicalizers_match_the_scalar_functions():
+    titles = pd.Series(
+        [
+            "Cafe del Mar - Radio Edit",
+            "Halo (Remastered 2011) [Live]",
+            "Señorita (Acoustic) (feat. X)",
+            "Song - Part 2",
+            "x\x0b- live",
+            "  Sweetest Thing!!!  ",
+            "",
+            None,
+            float("nan"),
+        ],
+        index=[3, 3, 1, 0, 5, 6, 7, 8, 9],
+        dtype=object,
+    )
+    artists = pd.Series(
+        [["Beyoncé", "Jay-Z"], "['AC/DC', 'X']", "Björk, Thom", "[broken", [], None, 7],
+        dtype=object,
+    )
+
+    assert canon_title_series(titles).tolist() == [canon_title(t) for t in titles]
+    assert canon_title_series(titles).index.equals(titles.index)
+    assert canon_artist_primary_series(artists).tolist() == [
+        canon_artist_primary(a) for a in artists
+    ]
+
+
+def test_canonicalization_caches_repeated_strings_but_accepts_lists():
+    matcher._canon_title_text.cache_clear()
+
+    assert canon_title("Repeat (Live)") == canon_title("Repeat (Live)") == "repeat"
+    assert canon_artist_primary(["Björk"]) == canon_artist_primary("Björk") == "bjork"
+    assert matcher._canon_title_text.cache_info().hits == 1
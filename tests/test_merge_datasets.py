@@ -1,6 +1,7 @@
 from pathlib import Path
 
 import pandas as pd
+import pyarrow.parquet as pq
 import pytest
 
 from utils import merge_datasets
@@ -41,6 +42,12 @@ def test_artists_literal_is_parsed_as_an_exact_list():
     assert row["artist_primary_canon"] == "tyler, the creator"
 
 
+def test_artists_literal_with_mixed_quotes_matches_literal_eval():
+    row = _normalize(artists="[\"Guns N' Roses\", 'Slash', ' ']", name="Song")
+
+    assert row["artists_raw"] == ["Guns N' Roses", "Slash"]
+
+
 def test_delimited_artist_names_preserves_collaborators():
     row = _normalize(artist_names="ZAYN, PARTYNEXTDOOR", track_name="Song")
 
@@ -48,7 +55,9 @@ def test_delimited_artist_names_preserves_collaborators():
     assert row["artist_primary_canon"] == "zayn"
 
 
-def test_merge_uses_authoritative_sources_to_preserve_comma_bearing_artist_names(tmp_path):
+def test_merge_uses_authoritative_sources_to_preserve_comma_bearing_artist_names(
+    monkeypatch, tmp_path
+):
     chart_source = tmp_path / "chart.csv"
     pd.DataFrame(
         [
@@ -72,13 +81,70 @@ def test_merge_uses_authoritative_sources_to_preserve_comma_bearing_artist_names
         ]
     ).to_csv(authoritative_source, index=False)
 
+    read_csv = merge_datasets._read_csv_arrow
+    parsed = []
+
+    def counting_read_csv(path, *args, **kwargs):
+        parsed.append(Path(path).name)
+        return read_csv(path, *args, **kwargs)
+
+    monkeypatch.setattr(merge_datasets, "_read_csv_arrow", counting_read_csv)
     merged = merge_datasets.merge_datasets([str(chart_source), str(authoritative_source)])
     chart_row = merged.loc[merged["spotify_id"] == "chart-track"].iloc[0]
 
+    # The artist scan reuses the loaded frames instead of re-reading each file.
+    assert sorted(parsed) == ["catalog.csv", "chart.csv"]
+
     assert chart_row["artists_raw"] == ["Tyler, The Creator", "Kali Uchis"]
     assert chart_row["artist_primary_canon"] == "tyler, the creator"
 
 
+def _parallel_sources(tmp_path):
+    paths = []
+    for name, rows in {
+        "first.csv": [
+            {"id": "a", "name": "Song (Live)", "artists": "['X', 'Y']", "energy": 0.4},
+            {"id": None, "name": "Other", "artists": "Z", "energy": None},
+        ],
+        "second.csv": [
+            {"track_id": "a", "track_name": "Song", "artist_name": "X", "popularity": 7},
+        ],
+    }.items():
+        pd.DataFrame(rows).to_csv(tmp_path / name, index=False)
+        paths.append(str(tmp_path / name))
+    return paths
+
+
+def test_parallel_merge_matches_the_serial_merge(eager_parallelism, tmp_path):
+    paths = _parallel_sources(tmp_path)
+
+    pd.testing.assert_frame_equal(
+        merge_datasets.merge_datasets(paths, parallel=True), merge_datasets.merge_datasets(paths)
+    )
+
+
+def test_merge_starts_no_workers_unless_parallel(eager_parallelism, no_process_pools, tmp_path):
+    merged = merge_datasets.merge_datasets(_parallel_sources(tmp_path))
+
+    assert merged["spotify_id"].tolist() == ["a", None]
+
+
+def test_unkeyed_exact_duplicates_are_dropped(tmp_path):
+    source = tmp_path / "source.csv"
+    pd.DataFrame(
+        [
+            {"name": "Song", "artists": "", "energy": 0.1},
+            {"name": "Song", "artists": "", "energy": 0.9},
+            {"name": "Song", "artists": "", "duration_ms": 200_000},
+        ]
+    ).to_csv(source, index=False)
+
+    merged = merge_datasets.merge_datasets([str(source)])
+
+    assert merged["energy"].tolist()[0] == 0.1
+    assert merged["duration_ms"].isna().tolist() == [True, False]
+
+
 def test_merge_recomputes_title_and_artist_canonical_fields():
     sparse = {
         "spotify_id": "track-id",
@@ -101,6 +167,36 @@ def test_merge_recomputes_title_and_artist_canonical_fields():
     assert merged["artist_primary_canon"] == "tyler, the creator"
 
 
+def test_dedupe_merges_groups_fieldwise_and_keeps_unkeyed_rows_last():
+    def row(spotify_id, **values):
+        return {"spotify_id": spotify_id, "title_raw": "", "artists_raw": [], **values}
+
+    rows = pd.DataFrame(
+        [
+            row("a", popularity=10, duration_ms=200_000, energy=None, explicit=False),
+            row(None, title_raw="Unkeyed"),
+            row("b", title_raw="Solo"),
+            row("a", popularity=30, duration_ms=201_500, energy=0.4, title_raw="Song"),
+            row("a", popularity=None, duration_ms=205_000, energy=0.9, explicit=True),
+        ],
+        columns=merge_datasets.MERGED_COLUMNS,
+        dtype=object,
+    )
+    rows = rows.where(rows.notna(), None)
+
+    deduped = merge_datasets._dedupe_frame(
+        rows, rows[["spotify_id"]], rows["spotify_id"].notna().to_numpy()
+    )
+
+    assert deduped["spotify_id"].tolist() == ["a", "b", None]
+    merged = deduped.iloc[0]
+    assert merged["popularity"] == 30
+    assert merged["duration_ms"] == 201_500
+    assert merged["energy"] == 0.4
+    assert merged["explicit"] is True
+    assert (merged["title_raw"], merged["title_canon"]) == ("Song", "song")
+
+
 def test_missing_ids_and_titles_do_not_become_nan_strings():
     row = _normalize(id=float("nan"), name=float("nan"), artist_name="Artist")
 
@@ -109,6 +205,17 @@ def test_missing_ids_and_titles_do_not_become_nan_strings():
     assert row["title_canon"] == ""
 
 
+def test_normalize_row_treats_mapped_columns_missing_from_the_row_as_missing():
+    colmap = _auto_columns(pd.DataFrame(columns=["id", "name", "artists", "popularity", "energy"]))
+
+    row = _normalize_row({"id": "x", "name": "S", "artists": "A"}, colmap)
+
+    assert row["spotify_id"] == "x"
+    assert row["artist_primary_canon"] == "a"
+    assert row["popularity"] is None
+    assert row["energy"] is None
+
+
 @pytest.mark.parametrize(
     ("raw_value", "expected"),
     [("False", False), ("true", True), (0, False), (1, True), ("unknown", None)],
@@ -119,6 +226,60 @@ def test_explicit_values_are_parsed_without_string_truthiness(raw_value, expecte
     assert row["explicit"] is expected
 
 
+def test_numeric_columns_are_coerced_column_at_a_time():
+    frame = pd.DataFrame(
+        {
+            "name": ["a", "b", "c"],
+            "duration_ms": [200_000.7, float("inf"), None],
+            "popularity": ["12", "n/a", "3.0"],
+            "year": ["2001-05-01", 1999.0, None],
+            "energy": [1.4, -0.2, float("nan")],
+            "tempo": [0.0, 120.5, -3.0],
+            "key": [2.9, None, 11],
+        }
+    )
+
+    rows = merge_datasets._normalize_frame(frame, _auto_columns(frame))
+
+    assert rows["duration_ms"].tolist() == [200_000, None, None]
+    assert rows["popularity"].tolist() == [12, None, None]
+    assert rows["release_year"].tolist() == [2001, 1999, None]
+    assert rows["energy"].tolist() == [1.0, 0.0, None]
+    assert rows["tempo"].tolist() == [None, 120.5, None]
+    assert rows["key"].tolist() == [2, None, 11]
+
+
+def test_duration_buckets_round_half_to_even_like_round():
+    durations = pd.Series([0, 1499, 1500, 1501, 4500, 7500, 209_999]).to_numpy()
+
+    buckets = merge_datasets._duration_buckets(durations, 3000)
+
+    assert buckets.tolist() == [round(d / 3000) for d in durations.tolist()]
+
+
+def test_repeated_artist_values_are_parsed_once_without_aliasing(monkeypatch):
+    frame = pd.DataFrame(
+        {
+            "name": ["a", "b", "c", "d"],
+            "artists": ["['X', 'Y']", None, "['X', 'Y']", "['X', 'Y']"],
+        }
+    )
+    parse = merge_datasets._parse_artists
+    parsed = []
+
+    def counting_parse(value, *args, **kwargs):
+        parsed.append(value)
+        return parse(value, *args, **kwargs)
+
+    monkeypatch.setattr(merge_datasets, "_parse_artists", counting_parse)
+    rows = merge_datasets._normalize_frame(frame, _auto_columns(frame))
+
+    assert parsed == ["['X', 'Y']"]
+    assert rows["artists_raw"].tolist() == [["X", "Y"], [], ["X", "Y"], ["X", "Y"]]
+    assert rows["artist_primary_canon"].tolist() == ["x", "", "x", "x"]
+    assert rows.at[0, "artists_raw"] is not rows.at[2, "artists_raw"]
+
+
 def test_nonpositive_duration_bucket_is_rejected():
     with pytest.raises(ValueError, match="greater than zero"):
         merge_datasets.merge_datasets([], conservative_duration_ms=0)
@@ -143,7 +304,7 @@ def test_cache_write_removes_partial_temporary_file(monkeypatch, tmp_path):
     source.write_text("id\ntrack-id\n", encoding="utf-8")
     cache_dir = tmp_path / "cache"
     frame = pd.DataFrame({"spotify_id": ["track-id"]})
-    monkeypatch.setattr(merge_datasets, "merge_datasets", lambda paths: frame)
+    monkeypatch.setattr(merge_datasets, "merge_datasets", lambda paths, parallel=False: frame)
 
     def fail_write(self, path, **kwargs):
         Path(path).write_bytes(b"partial")
@@ -156,3 +317,146 @@ def test_cache_write_removes_partial_temporary_file(monkeypatch, tmp_path):
 
     assert list(cache_dir.glob("*.tmp.parquet")) == []
     assert list(cache_dir.glob("merged_*.parquet")) == []
+
+
+def test_catalog_indexes_are_cached_and_reused(monkeypatch, tmp_path):
+    cache_dir = tmp_path / "cache"
+    frame = pd.DataFrame(
+        {"spotify_id": ["track-id"], "title_raw": ["Song"], "artists_raw": [["Artist"]]}
+    )
+
+    built = merge_datasets.get_catalog_indexes(frame, cache_dir=str(cache_dir))
+
+    def fail_build(df, parallel=False):
+        raise AssertionError("cached indexes should be reused")
+
+    monkeypatch.setattr(merge_datasets, "build_indexes", fail_build)
+    cached = merge_datasets.get_catalog_indexes(frame, cache_dir=str(cache_dir))
+
+    assert len(list(cache_dir.glob("indexes_*.npz"))) == 1
+    assert cached["by_id"] == built["by_id"] == {"track-id": 0}
+    assert cached["by_key"][("song", "artist")].tolist() == [0]
+
+
+def test_catalog_indexes_are_keyed_by_catalog_content(tmp_path):
+    cache_dir = tmp_path / "cache"
+    frame = pd.DataFrame(
+        {
+            "spotify_id": ["a", "b"],
+            "title_raw": ["Song", "Other"],
+            "artists_raw": [["Artist"], ["Artist"]],
+        }
+    )
+
+    full = merge_datasets.get_catalog_indexes(frame, cache_dir=str(cache_dir))
+    subset = merge_datasets.get_catalog_indexes(frame.iloc[1:], cache_dir=str(cache_dir))
+
+    assert len(list(cache_dir.glob("indexes_*.npz"))) == 2
+    assert full["by_id"] == {"a": 0, "b": 1}
+    assert subset["by_id"] == {"b": 0}
+
+
+def test_catalog_indexes_follow_the_row_order_of_the_loaded_catalog(tmp_path):
+    cache_dir = tmp_path / "cache"
+    frame = pd.DataFrame(
+        {
+            "spotify_id": ["a", "b"],
+            "title_raw": ["Song", "Other"],
+            "artists_raw": [["Artist"], ["Artist"]],
+        }
+    )
+    frame["artist_primary_canon"] = "artist"
+    merge_datasets._register_catalog(frame, cache_dir)
+
+    loaded = merge_datasets.get_catalog_indexes(frame, cache_dir=str(cache_dir))
+    reordered = merge_datasets.get_catalog_indexes(frame.iloc[::-1], cache_dir=str(cache_dir))
+
+    assert len(list(cache_dir.glob("indexes_*.npz"))) == 2
+    assert loaded["by_id"] == {"a": 0, "b": 1}
+    assert reordered["by_id"] == {"b": 0, "a": 1}
+
+
+def test_merged_dataset_is_registered_under_its_content(monkeypatch, tmp_path):
+    source = tmp_path / "source.csv"
+    source.write_text("id\ntrack-id\n", encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(
+        merge_datasets,
+        "merge_datasets",
+        lambda paths, parallel=False: pd.DataFrame(
+            {"spotify_id": ["track-id"], "title_canon": ["song"], "artist_primary_canon": ["a"]}
+        ),
+    )
+
+    built = merge_datasets.get_merged_dataset([str(source)], cache_dir=str(cache_dir))
+    cached = merge_datasets.get_merged_dataset([str(source)], cache_dir=str(cache_dir))
+
+    assert merge_datasets._loaded_catalog_identity(built) == (
+        merge_datasets._loaded_catalog_identity(cached)
+    )
+    assert merge_datasets._loaded_catalog_identity(cached)[1] == str(cache_dir)
+    assert merge_datasets._loaded_catalog_identity(cached.copy()) is None
+    for column in ("spotify_id", "title_canon", "artist_primary_canon"):
+        assert isinstance(cached[column].dtype, pd.CategoricalDtype)
+
+
+def test_merged_dataset_keeps_merge_order(monkeypatch, tmp_path):
+    source = tmp_path / "source.csv"
+    source.write_text("id\nb\n", encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(
+        merge_datasets,
+        "merge_datasets",
+        lambda paths, parallel=False: pd.DataFrame(
+            {"spotify_id": ["b", None, "a"], "title_raw": ["B", "", "A"]}
+        ),
+    )
+
+    built = merge_datasets.get_merged_dataset([str(source)], cache_dir=str(cache_dir))
+    cached = merge_datasets.get_merged_dataset([str(source)], cache_dir=str(cache_dir))
+
+    for frame in (built, cached):
+        assert frame["title_raw"].tolist() == ["B", "", "A"]
+        assert frame.index.equals(pd.RangeIndex(3))
+    [target] = cache_dir.glob("merged_*.parquet")
+    assert pq.ParquetFile(target).metadata.row_group(0).column(0).compression == "ZSTD"
+
+
+def test_loaded_catalog_supports_ordinary_spotify_id_operations(monkeypatch, tmp_path):
+    source = tmp_path / "source.csv"
+    source.write_text("id\nb\n", encoding="utf-8")
+    monkeypatch.setattr(
+        merge_datasets,
+        "merge_datasets",
+        lambda paths, parallel=False: pd.DataFrame(
+            {"spotify_id": ["b", "a", "b"], "popularity": [1, 2, 3]}
+        ),
+    )
+    catalog = merge_datasets.get_merged_dataset([str(source)], cache_dir=str(tmp_path / "cache"))
+
+    totals = catalog.groupby("spotify_id", observed=True)["popularity"].sum()
+    labels = pd.DataFrame({"spotify_id": ["a", "b"], "label": [True, False]})
+
+    assert totals.to_dict() == {"a": 2, "b": 4}
+    assert catalog.sort_values("spotify_id")["popularity"].tolist() == [2, 1, 3]
+    assert catalog.merge(labels, on="spotify_id")["label"].tolist() == [False, True, False]
+    assert catalog.reset_index(drop=True)["spotify_id"].tolist() == ["b", "a", "b"]
+    assert "index" in catalog.reset_index().columns
+
+
+def test_source_csvs_are_read_with_only_mapped_columns(tmp_path):
+    source = tmp_path / "source.csv"
+    source.write_text("id,name,unused_blob\ntrack-id,Song,xxxxxxxx\n", encoding="utf-8")
+
+    frame = merge_datasets._read_source_csv(str(source))
+
+    assert list(frame.columns) == ["id", "name"]
+
+
+def test_ragged_source_csv_falls_back_to_the_c_parser(tmp_path):
+    source = tmp_path / "ragged.csv"
+    source.write_text("id,name,popularity\nshort,Short Row\nfull,Full Row,40\n", encoding="utf-8")
+
+    merged = merge_datasets.merge_datasets([str(source)])
+
+    assert sorted(merged["spotify_id"]) == ["full", "short"]
@@ -58,9 +58,9 @@ def test_transform_uses_training_medians_for_imputation():
 
     transformed = transform(user_tracks, scaler)
     expected_raw = _extract_feature_matrix(user_tracks, FEATURE_COLS)
-    expected_raw.loc[0, "danceability"] = 0.5
-    expected_raw = expected_raw.fillna(pd.Series(scaler.impute_values_, index=FEATURE_COLS))
-    expected = scaler.transform(expected_raw.values.astype(np.float32)).astype(np.float32)
+    expected_raw[0, FEATURE_COLS.index("danceability")] = 0.5
+    expected_raw = np.where(np.isnan(expected_raw), scaler.impute_values_.to_numpy(), expected_raw)
+    expected = scaler.transform(expected_raw.astype(np.float32)).astype(np.float32)
 
     assert scaler.impute_values_["danceability"] == pytest.approx(0.5)
     assert transformed[0, FEATURE_COLS.index("danceability")] == pytest.approx(
@@ -72,20 +72,21 @@ def test_extract_feature_matrix_converts_duration_seconds_fallback():
     df = pd.DataFrame([_feature_row(duration=210.0)])
     df = df.drop(columns=["duration_ms"])
 
-    Xdf = _extract_feature_matrix(df, FEATURE_COLS)
+    X = _extract_feature_matrix(df, FEATURE_COLS)
 
-    assert list(Xdf.columns) == FEATURE_COLS
-    assert Xdf.loc[0, "duration_ms"] == pytest.approx(np.log1p(3.5))
+    assert X.shape == (1, len(FEATURE_COLS))
+    assert X.dtype == np.float32
+    assert X[0, FEATURE_COLS.index("duration_ms")] == pytest.approx(np.log1p(3.5))
 
 
 def test_extract_feature_matrix_clips_and_transforms_special_columns():
     df = pd.DataFrame([_feature_row(tempo=500.0, loudness=5.0, duration_ms=2_400_000)])
 
-    Xdf = _extract_feature_matrix(df, FEATURE_COLS)
+    X = _extract_feature_matrix(df, FEATURE_COLS)
 
-    assert Xdf.loc[0, "tempo"] == pytest.approx(np.log1p(300.0))
-    assert Xdf.loc[0, "loudness"] == 0.0
-    assert Xdf.loc[0, "duration_ms"] == pytest.approx(np.log1p(20.0))
+    assert X[0, FEATURE_COLS.index("tempo")] == pytest.approx(np.log1p(300.0))
+    assert X[0, FEATURE_COLS.index("loudness")] == 0.0
+    assert X[0, FEATURE_COLS.index("duration_ms")] == pytest.approx(np.log1p(20.0))
 
 
 def test_extract_feature_matrix_raises_for_missing_required_columns():
@@ -93,3 +94,18 @@ def test_extract_feature_matrix_raises_for_missing_required_columns():
 
     with pytest.raises(KeyError, match="Missing required feature columns"):
         _extract_feature_matrix(df, FEATURE_COLS)
+
+
+def test_transform_reuses_fitted_medians_without_recomputing(monkeypatch):
+    catalog = pd.DataFrame([_feature_row(energy=0.2), _feature_row(energy=0.8)])
+    scaler = fit_scaler(catalog, FEATURE_COLS)
+
+    def fail_median(*args, **kwargs):
+        raise AssertionError("transform should not recompute medians")
+
+    monkeypatch.setattr(pd.DataFrame, "median", fail_median)
+    transformed = transform(pd.DataFrame([_feature_row(energy=None)]), scaler, FEATURE_COLS)
+
+    assert scaler.feature_medians_.dtype == np.float32
+    assert transformed.dtype == np.float32
+    assert transformed[0, FEATURE_COLS.index("energy")] == pytest.approx(0.0, abs=1e-6)
@@ -35,3 +35,17 @@ def test_build_user_profile_requires_a_2d_finite_result():
 
     with pytest.raises(ValueError, match="finite"):
         build_user_profile(np.array([[1.0, np.nan], [2.0, np.nan]], dtype=np.float32))
+
+
+def test_build_user_profile_ignores_missing_values_per_feature():
+    X_user = np.array(
+        [
+            [1.0, np.nan],
+            [3.0, 4.0],
+            [np.nan, 8.0],
+        ],
+        dtype=np.float32,
+    )
+
+    np.testing.assert_allclose(build_user_profile(X_user, method="mean"), [2.0, 6.0])
+    np.testing.assert_allclose(build_user_profile(X_user, method="median"), [2.0, 6.0])
@@ -1,11 +1,15 @@
+import numpy as np
 import pandas as pd
 
+import recommender.recommend as recommend_module
 from recommender.recommend import (
+    _top_positions,
     prepare_recommendation_candidates,
     recommend,
     recommend_from_catalog,
     recommend_from_prepared_candidates,
 )
+from utils.merge_datasets import _register_catalog
 
 
 def _track(spotify_id, danceability, energy, popularity=80, release_year=2020):
@@ -320,3 +324,136 @@ def test_recommend_from_catalog_exposes_candidate_pool_metadata():
 
     assert recs.attrs["candidate_pool_size"] == 1
     assert recs.attrs["candidate_min_popularity"] == 20
+
+
+def test_cached_catalog_embedding_matches_on_the_fly_scoring(tmp_path):
+    catalog = pd.DataFrame(
+        [
+            _track("seed", 0.9, 0.8),
+            _track("close", 0.88, 0.78),
+            _track("mid", 0.5, 0.4),
+            _track("far", 0.1, 0.2),
+            _track("filtered", 0.9, 0.8, popularity=5),
+        ]
+    )
+    user_tracks = catalog[catalog["spotify_id"] == "seed"].copy()
+    cached_catalog = catalog.copy()
+    _register_catalog(cached_catalog, tmp_path)
+
+    expected = recommend_from_catalog(catalog, user_tracks, top_n=3, pca_components=3)
+    actual = recommend_from_catalog(cached_catalog, user_tracks, top_n=3, pca_components=3)
+
+    assert list(tmp_path.glob("catalog_pca_unit_*.npy"))
+    assert actual["spotify_id"].tolist() == expected["spotify_id"].tolist()
+    # The cached embedding is stored at half precision.
+    np.testing.assert_allclose(actual["similarity"], expected["similarity"], atol=2e-3)
+
+
+def test_cached_catalog_embedding_is_not_reused_for_reordered_or_rebuilt_catalogs(tmp_path):
+    tracks = [
+        _track("seed", 0.9, 0.8),
+        _track("close", 0.88, 0.78),
+        _track("mid", 0.5, 0.4),
+        _track("far", 0.1, 0.2),
+    ]
+    catalog = pd.DataFrame(tracks)
+    _register_catalog(catalog, tmp_path)
+    user_tracks = catalog.head(1).copy()
+    recommend_from_catalog(catalog, user_tracks, top_n=3, pca_components=2)
+
+    reordered = catalog.iloc[::-1]
+    rebuilt = pd.DataFrame([tracks[0], _track("close", 0.1, 0.2), *tracks[2:]])
+    _register_catalog(rebuilt, tmp_path)
+
+    for candidates in (reordered, rebuilt):
+        expected = recommend_from_catalog(candidates.copy(), user_tracks, top_n=3, pca_components=2)
+        actual = recommend_from_catalog(candidates, user_tracks, top_n=3, pca_components=2)
+
+        assert actual["spotify_id"].tolist() == expected["spotify_id"].tolist()
+        np.testing.assert_allclose(actual["similarity"], expected["similarity"], atol=2e-3)
+    assert len(list(tmp_path.glob("catalog_pca_unit_*.npy"))) == 2
+
+
+def test_top_positions_selects_best_first_with_stable_ties():
+    scores = np.array([0.2, np.nan, 0.9, 0.5, 0.9, 0.1])
+
+    assert _top_positions(scores, 3).tolist() == [2, 4, 3]
+    assert _top_positions(scores, 10).tolist() == [2, 4, 3, 0, 5, 1]
+    assert _top_positions(scores, 0).tolist() == []
+
+
+def test_recommend_accepts_a_preloaded_catalog(monkeypatch):
+    catalog = pd.DataFrame(
+        [
+            _track("seed", 0.9, 0.8),
+            _track("close", 0.88, 0.78),
+            _track("far", 0.1, 0.2),
+        ]
+    )
+
+    def fail_load(catalog_paths):
+        raise AssertionError("a loaded catalog should not be reloaded")
+
+    monkeypatch.setattr("recommender.recommend.get_merged_dataset", fail_load)
+
+    recs = recommend(catalog, catalog.head(1), top_n=1, use_pca=False)
+
+    assert recs["spotify_id"].tolist() == ["close"]
+
+
+def test_cached_catalog_embedding_skips_the_candidate_transform(monkeypatch, tmp_path):
+    catalog = pd.DataFrame(
+        [
+            _track("seed", 0.9, 0.8),
+            _track("close", 0.88, 0.78),
+            _track("far", 0.1, 0.2),
+        ]
+    )
+    _register_catalog(catalog, tmp_path)
+    user_tracks = catalog.head(1)
+    recommend_from_catalog(catalog, user_tracks, top_n=1, pca_components=2)
+
+    transformed_rows = []
+    transform = recommend_module.transform
+
+    def counting_transform(df, *args, **kwargs):
+        transformed_rows.append(len(df))
+        return transform(df, *args, **kwargs)
+
+    monkeypatch.setattr(recommend_module, "transform", counting_transform)
+    recs = recommend_from_catalog(catalog, user_tracks, top_n=1, pca_components=2)
+
+    assert recs["spotify_id"].tolist() == ["close"]
+    # Only the seed profile and the returned row's explanation are transformed.
+    assert transformed_rows == [1, 1]
+    assert recs["recommendation_reason"].str.startswith("Recommended because").all()
+
+
+def test_cached_catalog_features_skip_the_candidate_transform_without_pca(monkeypatch, tmp_path):
+    catalog = pd.DataFrame(
+        [
+            _track("seed", 0.9, 0.8),
+            _track("close", 0.88, 0.78),
+            _track("far", 0.1, 0.2),
+        ]
+    )
+    expected = recommend_from_catalog(catalog.copy(), catalog.head(1), top_n=2, use_pca=False)
+    _register_catalog(catalog, tmp_path)
+    user_tracks = catalog.head(1)
+    recommend_from_catalog(catalog, user_tracks, top_n=2, use_pca=False)
+
+    transformed_rows = []
+    transform = recommend_module.transform
+
+    def counting_transform(df, *args, **kwargs):
+        transformed_rows.append(len(df))
+        return transform(df, *args, **kwargs)
+
+    monkeypatch.setattr(recommend_module, "transform", counting_transform)
+    recs = recommend_from_catalog(catalog, user_tracks, top_n=2, use_pca=False)
+
+    assert list(tmp_path.glob("catalog_scaled_*.npy"))
+    assert recs["spotify_id"].tolist() == expected["spotify_id"].tolist()
+    np.testing.assert_allclose(recs["similarity"], expected["similarity"], rtol=1e-6)
+    # Only the seed profile and the returned rows' explanations are transformed.
+    assert transformed_rows == [1, 2]
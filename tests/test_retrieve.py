@@ -36,3 +36,36 @@ def test_filter_candidates_treats_missing_popularity_conservatively():
     filtered = filter_candidates(catalog, min_popularity=20)
 
     assert filtered["spotify_id"].tolist() == ["known"]
+
+
+def test_filter_candidates_drops_missing_release_years_for_year_range():
+    catalog = pd.DataFrame(
+        {
+            "spotify_id": ["unknown", "in_range", "artist_excluded"],
+            "artist_primary_canon": ["a", "b", "seed artist"],
+            "popularity": [50, 50, 50],
+            "release_year": pd.array([None, 2010, 2010], dtype="Int64"),
+        }
+    )
+
+    filtered = filter_candidates(
+        catalog,
+        exclude_artists=["seed artist"],
+        year_range=(2000, 2020),
+    )
+
+    assert filtered["spotify_id"].tolist() == ["in_range"]
+
+
+def test_filter_candidates_excludes_ids_from_categorical_column():
+    catalog = pd.DataFrame(
+        {
+            "spotify_id": pd.Categorical(["seed", "keep", None, "other"]),
+            "artist_primary_canon": ["a", "b", "c", "d"],
+        }
+    )
+
+    filtered = filter_candidates(catalog, exclude_ids=["seed", "other", "not-in-catalog"])
+
+    assert filtered["spotify_id"].tolist()[0] == "keep"
+    assert len(filtered) == 2
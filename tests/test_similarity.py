@@ -3,7 +3,7 @@ import warnings
 import numpy as np
 import pytest
 
-from recommender.similarity import cosine
+from recommender.similarity import cosine, cosine_unit
 
 
 def test_cosine_handles_zero_candidate_vectors_without_runtime_warnings():
@@ -20,3 +20,22 @@ def test_cosine_handles_zero_candidate_vectors_without_runtime_warnings():
 def test_cosine_rejects_mismatched_feature_dimensions_before_zero_shortcut():
     with pytest.raises(ValueError, match="same number of features"):
         cosine(np.zeros(2, dtype=np.float32), np.zeros((3, 4), dtype=np.float32))
+
+
+def test_cosine_reuses_precomputed_row_norms():
+    query = np.array([3.0, 4.0], dtype=np.float32)
+    candidates = np.array([[6.0, 8.0], [-4.0, 3.0], [0.0, 0.0]], dtype=np.float32)
+    norms = np.linalg.norm(candidates, axis=1)
+
+    np.testing.assert_allclose(cosine(query, candidates, norms), [1.0, 0.0, 0.0], atol=1e-6)
+    np.testing.assert_allclose(cosine(query, candidates, norms), cosine(query, candidates))
+
+
+def test_cosine_unit_upcasts_half_precision_rows():
+    query = np.array([3.0, 4.0], dtype=np.float32)
+    candidates = np.array([[0.6, 0.8], [-0.8, 0.6], [0.0, 0.0]], dtype=np.float16)
+
+    similarities = cosine_unit(query, candidates)
+
+    assert similarities.dtype == np.float32
+    np.testing.assert_allclose(similarities, [1.0, 0.0, 0.0], atol=1e-3)
@@ -1,6 +1,8 @@
 import pandas as pd
 import pytest
+from spotipy import Spotify
 
+from utils import spotify_integration
 from utils.spotify_integration import (
     MEMBERSHIP_COLUMNS,
     extract_playlist_id,
@@ -48,6 +50,80 @@ def test_fetch_playlist_profile_uses_2026_items_endpoint_and_shape():
     assert result["spotify_id"].tolist() == ["track-id"]
 
 
+def test_playlist_pages_after_the_first_are_fetched_by_offset_in_order(monkeypatch):
+    monkeypatch.setattr(spotify_integration, "PLAYLIST_PAGE_SIZE", 2)
+
+    class FakeSpotify:
+        def __init__(self):
+            self.offsets = []
+
+        def _get(self, path, limit, additional_types, offset=0):
+            self.offsets.append(offset)
+            ids = [f"track-{i}" for i in range(offset, min(offset + limit, 5))]
+            return {
+                "items": [{"item": {"id": track_id}} for track_id in ids],
+                "total": 5,
+                "next": "more" if offset + limit < 5 else None,
+            }
+
+        def next(self, results):
+            raise AssertionError("pages should be requested by offset")
+
+    sp = FakeSpotify()
+
+    tracks = list(spotify_integration._iter_playlist_tracks(sp, "playlist-id"))
+
+    assert sorted(sp.offsets) == [0, 2, 4]
+    assert tracks == [(i, {"id": f"track-{i}"}) for i in range(5)]
+
+
+def test_playlist_page_workers_use_their_own_clients_with_the_callers_token(monkeypatch):
+    monkeypatch.setattr(spotify_integration, "PLAYLIST_PAGE_SIZE", 2)
+
+    class FakeAuthManager:
+        def get_access_token(self, as_dict=False):
+            return "token"
+
+    calls = []
+
+    def fake_get(self, path, limit, additional_types, offset=0):
+        calls.append((offset, self, self._auth, self.auth_manager))
+        ids = [f"track-{i}" for i in range(offset, min(offset + limit, 5))]
+        return {"items": [{"item": {"id": track_id}} for track_id in ids], "total": 5, "next": "x"}
+
+    monkeypatch.setattr(Spotify, "_get", fake_get)
+    sp = Spotify(auth_manager=FakeAuthManager())
+
+    tracks = list(spotify_integration._iter_playlist_tracks(sp, "playlist-id"))
+
+    assert len(tracks) == 5
+    [(_, first_client, _, _)] = [call for call in calls if call[0] == 0]
+    assert first_client is sp
+    for offset, client, token, auth_manager in calls:
+        if offset:
+            assert client is not sp
+            assert (token, auth_manager) == ("token", None)
+
+
+def test_playlist_pages_stop_at_an_empty_offset_page(monkeypatch):
+    monkeypatch.setattr(spotify_integration, "PLAYLIST_PAGE_SIZE", 2)
+
+    class FakeSpotify:
+        def _get(self, path, limit, additional_types, offset=0):
+            if offset == 2:
+                return None
+            ids = [f"track-{i}" for i in range(offset, min(offset + limit, 5))]
+            return {
+                "items": [{"item": {"id": track_id}} for track_id in ids],
+                "total": 5,
+                "next": "more",
+            }
+
+    tracks = list(spotify_integration._iter_playlist_tracks(FakeSpotify(), "playlist-id"))
+
+    assert tracks == [(0, {"id": "track-0"}), (1, {"id": "track-1"})]
+
+
 def test_fetch_playlist_profile_deduplicates_repeated_source_tracks():
     class FakeSpotify:
         def _get(self, path, **kwargs):
@@ -191,3 +267,23 @@ def test_fetch_playlist_membership_supports_dataframe_indexes():
             "matched": True,
         }
     ]
+
+
+def test_fetch_playlist_profile_keeps_dataframe_matches_aligned_around_misses():
+    class FakeSpotify:
+        def _get(self, path, **kwargs):
+            ids = ["second", "missing", "first", "second"]
+            return {"items": [{"item": {"id": track_id}} for track_id in ids], "next": None}
+
+    catalog = pd.DataFrame({"spotify_id": ["first", "second"], "energy": [0.1, 0.2]})
+    indexes = {"by_id": {"first": 0, "second": 1}, "by_key": {}, "by_artist": {}}
+
+    result, stats = fetch_playlist_profile(
+        FakeSpotify(), "playlist-id", indexes, catalog, return_stats=True
+    )
+
+    assert result.to_dict("records") == [
+        {"spotify_id": "second", "energy": 0.2},
+        {"spotify_id": "first", "energy": 0.1},
+    ]
+    assert stats == {"total_tracks": 4, "matched_tracks": 2}
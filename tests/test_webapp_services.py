@@ -45,10 +45,21 @@ def test_fetch_album_art_urls_uses_current_individual_endpoint_and_preserves_ord
 
     urls = services.fetch_album_art_urls(sp, spotify_ids)
 
-    assert sp.track_ids == spotify_ids
+    # Requests run concurrently, so only the result order is deterministic.
+    assert sorted(sp.track_ids) == sorted(spotify_ids)
     assert urls == [f"{spotify_id}-medium" for spotify_id in spotify_ids]
 
 
+def test_fetch_album_art_urls_requests_repeated_tracks_once():
+    sp = FakeSpotify()
+
+    urls = services.fetch_album_art_urls(sp, ["a", "bad", "a"])
+
+    assert sorted(sp.track_ids) == ["a", "bad"]
+    assert urls == ["a-medium", None, "a-medium"]
+    assert services.fetch_album_art_urls(sp, []) == []
+
+
 def test_fetch_album_art_urls_handles_missing_tracks_and_images():
     class IncompleteSpotify:
         def track(self, spotify_id):
@@ -178,7 +178,7 @@ class CatalogStore:
             return tracks
 
         requested_order = {spotify_id: index for index, spotify_id in enumerate(ids)}
-        tracks["_requested_order"] = tracks["spotify_id"].map(requested_order)
+        tracks["_requested_order"] = tracks["spotify_id"].astype(object).map(requested_order)
         tracks = tracks.sort_values("_requested_order").drop(columns="_requested_order")
         return self._optimize_dtypes(tracks).reset_index(drop=True)
 
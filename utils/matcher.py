@@ -1,9 +1,18 @@
 import ast
+import multiprocessing
+import os
 import re
+import sys
 import unicodedata
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain, pairwise
+from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 # === Canonicalization ===
 
@@ -22,12 +31,23 @@ TITLE_VARIANT_KEYWORDS = (
     "extended mix",
 )
 
+_KW_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, TITLE_VARIANT_KEYWORDS)) + r")\b")
+_BRACKET_RE = re.compile(r"(.*?)([\(\[\{]([^()\[\]{}]+)[\)\]\}])\s*$")
+_DASH_RE = re.compile(r"^(.*?)(\s*-\s*(.+))$")
+_CLOSING_BRACKETS = (")", "]", "}")
+_PUNCT_RE = re.compile(r"[^\w\s]")
+# ASCII-only equivalent of _PUNCT_RE.sub(" ", ...) for already-folded text.
+_PUNCT_TABLE = str.maketrans({c: " " for c in map(chr, range(128)) if _PUNCT_RE.match(c)})
+
 
 def normalize_ascii(s: str) -> str:
     """
     Fold accents and strip to plain ASCII.
     """
     s = str(s or "")
+    if s.isascii():
+        # NFKD leaves ASCII unchanged, and most catalog strings are ASCII.
+        return s
     return unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("ascii")
 
 
@@ -35,15 +55,25 @@ def canon_title(title: str) -> str:
     """
     Canonicalize a title: strip accents, lowercase, remove variant tags, normalize spacing.
     """
+    return _canon_title_text(str(title or ""))
+
+
+# The same titles and artists recur across source datasets and playlists.
+_CANON_CACHE_SIZE = 1 << 17
+
+
+@lru_cache(maxsize=_CANON_CACHE_SIZE)
+def _canon_title_text(title: str) -> str:
     t = normalize_ascii(title).strip().lower()
 
     def contains_kw(seg: str) -> bool:
-        seg = seg.lower()
-        return any(re.search(rf"\b{re.escape(kw)}\b", seg) for kw in TITLE_VARIANT_KEYWORDS)
+        # seg is a slice of the already-lowercased title
+        return _KW_RE.search(seg) is not None
 
-    # strip trailing bracket segments with keywords
-    while True:
-        m = re.search(r"(.*?)([\(\[\{]([^()\[\]{}]+)[\)\]\}])\s*$", t)
+    # strip trailing bracket segments with keywords; most titles have no
+    # trailing bracket, so check the last character before running the regex
+    while t.endswith(_CLOSING_BRACKETS):
+        m = _BRACKET_RE.search(t)
         if not m:
             break
         if contains_kw(m.group(3)):
@@ -52,35 +82,143 @@ def canon_title(title: str) -> str:
             break
 
     # strip trailing dash suffix with keywords
-    m = re.search(r"^(.*?)(\s*-\s*(.+))$", t)
-    if m and contains_kw(m.group(3)):
-        t = m.group(1).rstrip()
+    if "-" in t:
+        m = _DASH_RE.search(t)
+        if m and contains_kw(m.group(3)):
+            t = m.group(1).rstrip()
 
-    # normalize spaces/punct
-    t = re.sub(r"[^\w\s]", " ", t)
-    return re.sub(r"\s+", " ", t).strip()
+    # normalize spaces/punct (t is ASCII after normalize_ascii)
+    return " ".join(t.translate(_PUNCT_TABLE).split())
 
 
-def canon_artist_primary(artists_raw) -> str:
+# A stringified list of plain quoted strings (no escapes or line breaks), which
+# ast.literal_eval would parse to the same values; anything else falls back to it.
+_QUOTED_ITEM = r"""(?:'[^'\\\r\n\x00]*'|"[^"\\\r\n\x00]*")"""
+_LIST_SPACE = r"[ \t\r\n\f]*"
+_QUOTED_LIST_RE = re.compile(
+    rf"\[{_LIST_SPACE}({_QUOTED_ITEM})(?:{_LIST_SPACE},{_LIST_SPACE}{_QUOTED_ITEM})*"
+    rf"{_LIST_SPACE},?{_LIST_SPACE}\]\Z"
+)
+_QUOTED_ITEM_RE = re.compile(_QUOTED_ITEM)
+
+
+def _literal_string_list(text: str) -> list[str] | None:
     """
-    Canonicalize the first artist in a list/string.
+    ast.literal_eval(text) for a stringified list of plain quoted strings, or
+    None when ``text`` is anything else.
     """
-    if isinstance(artists_raw, list) and artists_raw:
-        primary = artists_raw[0]
-    elif isinstance(artists_raw, str):
+    if not _QUOTED_LIST_RE.match(text):
+        return None
+    return [item[1:-1] for item in _QUOTED_ITEM_RE.findall(text)]
+
+
+def _primary_artist(artists_raw):
+    # Lists read back from Parquet arrive as NumPy arrays.
+    if isinstance(artists_raw, (list, tuple, np.ndarray)):
+        return artists_raw[0] if len(artists_raw) else ""
+    if isinstance(artists_raw, str):
         txt = artists_raw.strip()
         if txt.startswith("["):
+            simple = _QUOTED_LIST_RE.match(txt)
+            if simple:
+                return simple.group(1)[1:-1]
             try:
                 parsed = ast.literal_eval(txt)
-                primary = parsed[0] if isinstance(parsed, (list, tuple)) and parsed else ""
-            except (SyntaxError, ValueError):
-                primary = txt.split(",")[0]
-        else:
-            primary = txt.split(",")[0]
-    else:
-        primary = ""
-    primary = normalize_ascii(primary).strip().lower()
-    return re.sub(r"\s+", " ", primary)
+                return parsed[0] if isinstance(parsed, (list, tuple)) and parsed else ""
+            except (SyntaxError, ValueError, TypeError, MemoryError, RecursionError):
+                return txt.split(",")[0]
+        return txt.split(",")[0]
+    return ""
+
+
+def canon_artist_primary(artists_raw) -> str:
+    """
+    Canonicalize the first artist in a list/string.
+    """
+    return _canon_artist_text(str(_primary_artist(artists_raw) or ""))
+
+
+@lru_cache(maxsize=_CANON_CACHE_SIZE)
+def _canon_artist_text(artist: str) -> str:
+    return " ".join(normalize_ascii(artist).lower().split())
+
+
+# === Vectorized canonicalization ===
+
+# RE2 (pyarrow.compute) counterparts of the patterns above. Inputs are folded to
+# ASCII first and the whitespace RE2's \s lacks is mapped to spaces, so \w, \s,
+# and \b agree with Python's semantics.
+_EXTRA_WHITESPACE_RE2 = r"[\x0b\x1c-\x1f]"
+_BRACKET_SPLIT_RE2 = r"(?P<head>.*?)[\(\[\{](?P<tail>[^()\[\]{}]+)[\)\]\}]\s*$"
+_DASH_SPLIT_RE2 = r"^(?P<head>.*?)\s*-\s*(?P<tail>.+)$"
+
+
+def _update_where(arr: pa.Array, mask: pa.Array, update) -> pa.Array:
+    """Apply ``update`` only to the elements selected by ``mask``."""
+    if not pc.any(mask).as_py():
+        return arr
+    return pc.replace_with_mask(arr, mask, update(pc.filter(arr, mask)))
+
+
+def _fold_ascii(arr: pa.Array) -> pa.Array:
+    arr = pc.utf8_normalize(arr, "NFKD")
+    return pc.replace_substring_regex(arr, r"[^\x00-\x7f]+", "")
+
+
+def _ascii_array(values: pd.Series) -> pa.Array:
+    """normalize_ascii over a Series, including its ``str(s or "")`` coercion."""
+    texts = values.where(values.astype(bool), "").astype(str)
+    arr = pa.array(texts.to_numpy(dtype=object), type=pa.string())
+    # As in normalize_ascii, plain ASCII skips normalization.
+    arr = _update_where(arr, pc.invert(pc.string_is_ascii(arr)), _fold_ascii)
+    return pc.replace_substring_regex(arr, _EXTRA_WHITESPACE_RE2, " ")
+
+
+def _collapse_non_word(arr: pa.Array) -> pa.Array:
+    # Punctuation becomes spaces and whitespace runs collapse, in one pass.
+    return pc.utf8_trim_whitespace(pc.replace_substring_regex(arr, r"[^\w]+", " "))
+
+
+def _strip_keyword_suffix(arr: pa.Array, pattern: str) -> tuple[pa.Array, bool]:
+    """Replace matches of ``pattern`` whose tail has a variant keyword by their head."""
+    parts = pc.extract_regex(arr, pattern)
+    strip = pc.fill_null(pc.match_substring_regex(parts.field("tail"), _KW_RE.pattern), False)
+    if not pc.any(strip).as_py():
+        return arr, False
+    return pc.if_else(strip, pc.utf8_rtrim_whitespace(parts.field("head")), arr), True
+
+
+def _strip_bracket_keywords(arr: pa.Array) -> pa.Array:
+    stripped = True
+    while stripped:
+        arr, stripped = _strip_keyword_suffix(arr, _BRACKET_SPLIT_RE2)
+    return arr
+
+
+def _strip_dash_keywords(arr: pa.Array) -> pa.Array:
+    return _strip_keyword_suffix(arr, _DASH_SPLIT_RE2)[0]
+
+
+def canon_title_series(titles: pd.Series) -> pd.Series:
+    """
+    canon_title over a whole Series using Arrow string kernels.
+    """
+    arr = pc.utf8_lower(pc.utf8_trim_whitespace(_ascii_array(titles)))
+    arr = _update_where(arr, pc.match_substring_regex(arr, r"[\)\]\}]$"), _strip_bracket_keywords)
+    arr = _update_where(arr, pc.match_substring(arr, "-"), _strip_dash_keywords)
+    arr = _collapse_non_word(arr)
+    return pd.Series(arr.to_numpy(zero_copy_only=False), index=titles.index, dtype=object)
+
+
+def canon_artist_primary_series(artists: pd.Series) -> pd.Series:
+    """
+    canon_artist_primary over a whole Series; only primary-artist extraction
+    runs per element.
+    """
+    primary = artists.map(_primary_artist).astype(object)
+    arr = pc.utf8_lower(_ascii_array(primary))
+    arr = pc.utf8_trim_whitespace(pc.replace_substring_regex(arr, r"\s+", " "))
+    return pd.Series(arr.to_numpy(zero_copy_only=False), index=artists.index, dtype=object)
 
 
 # variant tags to deprioritize in tie-breaking
@@ -96,89 +234,288 @@ VARIANT_TAGS = [
     "edit",
 ]
 
+# One pass over each lowered title instead of one scan per tag.
+_VARIANT_TAG_RE = re.compile("|".join(map(re.escape, VARIANT_TAGS)))
+
+# Bump when the arrays stored by build_indexes/save_indexes change.
+INDEX_SCHEMA_VERSION = 2
+
 # === Index building ===
 
 
-def build_indexes(df: pd.DataFrame):
+# Below this many values, worker start-up costs more than it saves.
+PARALLEL_CANON_MIN_VALUES = 200_000
+
+
+def _canonicalize_chunk(canonicalize, values: np.ndarray) -> list[str]:
+    return canonicalize(pd.Series(values, dtype=object)).tolist()
+
+
+def _canonicalize_all(values: np.ndarray, canonicalize, parallel: bool = False) -> list[str]:
+    """
+    Apply the Series canonicalizer ``canonicalize`` to every value. With
+    ``parallel``, large inputs fan out to worker processes.
+    """
+    workers = min(os.cpu_count() or 1, len(values) // (PARALLEL_CANON_MIN_VALUES // 2) or 1)
+    if not parallel or len(values) < PARALLEL_CANON_MIN_VALUES or workers < 2:
+        return _canonicalize_chunk(canonicalize, values)
+
+    chunks = np.array_split(values, workers)
+    # Spawned workers never inherit a forked copy of the caller's threads and
+    # locks (e.g. a web server's).
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        results = executor.map(_canonicalize_chunk, [canonicalize] * workers, chunks)
+        return list(chain.from_iterable(results))
+
+
+def _canonical_values(
+    df: pd.DataFrame, column: str, source: str, canonicalize, parallel: bool = False
+) -> np.ndarray:
     """
-    Build lookup dicts for fast matching, storing only row indices
-    (to keep pickled index size small).
+    Read a canonical column as an object array. merge_datasets always writes
+    the canonical columns, so they are trusted as-is; ``source`` is only
+    canonicalized for frames that lack ``column`` entirely.
     """
-    by_id, by_key, by_artist = {}, defaultdict(list), defaultdict(list)
+    if column in df.columns:
+        values = df[column].to_numpy(dtype=object, copy=True)
+        values[pd.isna(values)] = ""
+        return values
+    if source not in df.columns:
+        return np.full(len(df), "", dtype=object)
+    return np.array(
+        _canonicalize_all(df[source].to_numpy(dtype=object), canonicalize, parallel),
+        dtype=object,
+    )
+
+
+def _numeric_column(df: pd.DataFrame, column: str, fill_value: float = np.nan) -> np.ndarray:
+    if column not in df.columns:
+        return np.full(len(df), fill_value, dtype=np.float64)
+    values = pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    return np.where(np.isnan(values), fill_value, values)
 
-    for position, (_, row) in enumerate(df.iterrows()):
-        sid = row.get("spotify_id")
-        if sid:
-            by_id[sid] = position
 
-        title_canon = row.get("title_canon") or canon_title(row.get("title_raw", ""))
-        artist_canon = row.get("artist_primary_canon") or canon_artist_primary(
-            row.get("artists_raw", [])
+def _variant_flags(df: pd.DataFrame) -> np.ndarray:
+    """uint8 flag per row: 1 when the raw title contains any VARIANT_TAGS entry."""
+    if "title_raw" not in df.columns:
+        return np.zeros(len(df), dtype=np.uint8)
+    lowered = df["title_raw"].fillna("").astype(str).str.lower()
+    return lowered.str.contains(_VARIANT_TAG_RE, na=False).to_numpy(dtype=np.uint8)
+
+
+def _match_ranks(df: pd.DataFrame) -> np.ndarray:
+    """
+    Global int32 rank of every row under the _choose_best ordering: canonical
+    versions first, then highest popularity, then newest year, then row order.
+    """
+    # lexsort is stable and sorts by the last key first.
+    order = np.lexsort(
+        (
+            -_numeric_column(df, "release_year", fill_value=0.0),
+            -_numeric_column(df, "popularity", fill_value=0.0),
+            _variant_flags(df),
         )
+    )
+    ranks = np.empty(len(df), dtype=np.int32)
+    ranks[order] = np.arange(len(df), dtype=np.int32)
+    return ranks
+
 
-        if title_canon and artist_canon:
-            by_key[(title_canon, artist_canon)].append(position)
+def build_indexes(df: pd.DataFrame, parallel: bool = False):
+    """
+    Build lookup dicts for fast matching, storing only int32 row positions
+    (to keep pickled index size small) plus the duration and precomputed
+    rank arrays used to resolve ambiguous matches. ``parallel`` lets large
+    frames without canonical columns canonicalize in worker processes; only
+    command-line builds should set it.
+    """
+    positions = np.arange(len(df), dtype=np.int32)
+
+    if "spotify_id" in df.columns:
+        sids = df["spotify_id"].to_numpy(dtype=object)
+        has_id = pd.notna(sids) & (sids != "")
+        by_id = dict(zip(sids[has_id].tolist(), positions[has_id].tolist(), strict=True))
+    else:
+        by_id = {}
 
-        if artist_canon:
-            by_artist[artist_canon].append(position)
+    titles = _canonical_values(df, "title_canon", "title_raw", canon_title_series, parallel)
+    artists = _canonical_values(
+        df, "artist_primary_canon", "artists_raw", canon_artist_primary_series, parallel
+    )
 
-    return {"by_id": by_id, "by_key": by_key, "by_artist": by_artist}
+    has_artist = artists != ""
+    has_key = has_artist & (titles != "")
+    keys = pd.DataFrame({"title": titles[has_key], "artist": artists[has_key]})
+    key_positions = positions[has_key]
+    by_key = {
+        key: key_positions[group]
+        for key, group in keys.groupby(["title", "artist"], sort=False).indices.items()
+    }
+
+    artist_keys = pd.Series(artists[has_artist])
+    artist_positions = positions[has_artist]
+    by_artist = {
+        artist: artist_positions[group]
+        for artist, group in artist_keys.groupby(artist_keys, sort=False).indices.items()
+    }
+
+    return {
+        "by_id": by_id,
+        "by_key": by_key,
+        "by_artist": by_artist,
+        "duration_ms": _numeric_column(df, "duration_ms"),
+        "match_rank": _match_ranks(df),
+    }
+
+
+# === Index persistence ===
+
+
+def _pack_strings(values) -> tuple[np.ndarray, np.ndarray]:
+    """Encode strings as one UTF-8 byte buffer plus int64 offsets."""
+    encoded = [str(value).encode("utf-8") for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(value) for value in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def _unpack_strings(data: np.ndarray, offsets: np.ndarray) -> list[str]:
+    blob = data.tobytes()
+    return [blob[start:stop].decode("utf-8") for start, stop in pairwise(offsets.tolist())]
+
+
+def _pack_groups(groups: dict) -> tuple[list, np.ndarray, np.ndarray]:
+    """Flatten {key: positions} into keys, concatenated positions, and offsets."""
+    keys = list(groups)
+    offsets = np.zeros(len(keys) + 1, dtype=np.int64)
+    np.cumsum([len(groups[key]) for key in keys], out=offsets[1:])
+    flat = (
+        np.concatenate([np.asarray(groups[key], dtype=np.int32) for key in keys])
+        if keys
+        else np.empty(0, dtype=np.int32)
+    )
+    return keys, flat, offsets
+
+
+def save_indexes(indexes, path: str | Path) -> None:
+    """
+    Persist build_indexes output as an uncompressed .npz of flat NumPy arrays.
+    Strings are stored as UTF-8 buffers so loading never needs pickle.
+    """
+    id_keys = list(indexes["by_id"])
+    key_keys, key_positions, key_offsets = _pack_groups(indexes["by_key"])
+    artist_keys, artist_positions, artist_offsets = _pack_groups(indexes["by_artist"])
+
+    arrays = {
+        "id_positions": np.fromiter(
+            (indexes["by_id"][key] for key in id_keys), dtype=np.int32, count=len(id_keys)
+        ),
+        "key_positions": key_positions,
+        "key_offsets": key_offsets,
+        "artist_positions": artist_positions,
+        "artist_offsets": artist_offsets,
+        "duration_ms": indexes["duration_ms"],
+        "match_rank": indexes["match_rank"],
+    }
+    for name, values in (
+        ("id_keys", id_keys),
+        ("key_titles", [title for title, _ in key_keys]),
+        ("key_artists", [artist for _, artist in key_keys]),
+        ("artist_keys", artist_keys),
+    ):
+        arrays[f"{name}_data"], arrays[f"{name}_offsets"] = _pack_strings(values)
+
+    with Path(path).open("wb") as stream:
+        np.savez(stream, **arrays)
+
+
+def load_indexes(path: str | Path):
+    """
+    Load indexes written by save_indexes. Group values are views into one
+    contiguous int32 array per index.
+    """
+    with np.load(path, allow_pickle=False) as archive:
+        arrays = {name: archive[name] for name in archive.files}
+
+    def strings(name: str) -> list[str]:
+        return _unpack_strings(arrays[f"{name}_data"], arrays[f"{name}_offsets"])
+
+    def groups(keys, positions: np.ndarray, offsets: np.ndarray) -> dict:
+        return {
+            key: positions[start:stop]
+            for key, (start, stop) in zip(keys, pairwise(offsets.tolist()), strict=True)
+        }
+
+    def interned(name: str) -> list[str]:
+        # An artist repeats across all of its (title, artist) keys and by_artist;
+        # interning shares one string object instead of a decoded copy per key.
+        return list(map(sys.intern, strings(name)))
+
+    key_keys = list(zip(interned("key_titles"), interned("key_artists"), strict=True))
+    return {
+        "by_id": dict(zip(strings("id_keys"), arrays["id_positions"].tolist(), strict=True)),
+        "by_key": groups(key_keys, arrays["key_positions"], arrays["key_offsets"]),
+        "by_artist": groups(
+            interned("artist_keys"), arrays["artist_positions"], arrays["artist_offsets"]
+        ),
+        "duration_ms": arrays["duration_ms"],
+        "match_rank": arrays["match_rank"],
+    }
 
 
 # === Match resolution ===
 
 
-def match_track(track, indexes, df, duration_tol=2000):
+def match_position(track, indexes, duration_tol=2000) -> int | None:
     """
-    Resolve a Spotify API track dict to a row in df using prebuilt indexes.
+    Resolve a Spotify API track dict to a catalog row position using only the
+    prebuilt indexes, or None when nothing matches.
     """
     tid = track.get("id")
     if tid and tid in indexes["by_id"]:
-        return df.iloc[indexes["by_id"][tid]].to_dict()
+        return int(indexes["by_id"][tid])
 
     title_canon = canon_title(track.get("name", ""))
     artists = track.get("artists", [])
     artist_names = [a["name"] for a in artists] if artists else []
     artist_canon = canon_artist_primary(artist_names)
 
-    candidates_idx = indexes["by_key"].get((title_canon, artist_canon), [])
-    dur = track.get("duration_ms")
+    candidates = indexes["by_key"].get((title_canon, artist_canon))
+    if candidates is None:
+        return None
 
-    if dur and candidates_idx:
-        candidates_idx = [
-            i
-            for i in candidates_idx
-            if pd.notna(df.iloc[i].get("duration_ms"))
-            and abs(df.iloc[i]["duration_ms"] - dur) <= duration_tol
-        ]
+    dur = track.get("duration_ms")
+    if dur:
+        # NaN durations compare False and are dropped with out-of-tolerance rows.
+        durations = indexes["duration_ms"][candidates]
+        candidates = candidates[np.abs(durations - dur) <= duration_tol]
 
-    if not candidates_idx:
+    if len(candidates) == 0:
         return None
-    if len(candidates_idx) == 1:
-        return df.iloc[candidates_idx[0]].to_dict()
+    if len(candidates) == 1:
+        return int(candidates[0])
+    return _choose_best(candidates, indexes)
+
 
-    candidates = [df.iloc[i].to_dict() for i in candidates_idx]
-    return _choose_best(candidates)
+def _row_record(df: pd.DataFrame, position: int) -> dict:
+    # Same values as df.iloc[position].to_dict() without building an
+    # intermediate dict through Series.items().
+    return dict(zip(df.columns, df.iloc[position].tolist(), strict=True))
 
 
-def _choose_best(candidates):
+def match_track(track, indexes, df, duration_tol=2000):
     """
-    Prefer canonical versions over variants, then highest popularity & year.
+    Resolve a Spotify API track dict to a row in df using prebuilt indexes.
     """
+    position = match_position(track, indexes, duration_tol)
+    return None if position is None else _row_record(df, position)
 
-    def variant_score(row):
-        name = (row.get("title_raw") or "").lower()
-        for tag in VARIANT_TAGS:
-            if tag in name:
-                return 1  # variant
-        return 0  # canonical
 
-    sorted_cands = sorted(
-        candidates,
-        key=lambda r: (
-            variant_score(r),
-            -(r.get("popularity") or 0),
-            -(r.get("release_year") or 0),
-        ),
-    )
-    return sorted_cands[0]
+def _choose_best(candidates: np.ndarray, indexes) -> int:
+    """
+    Prefer canonical versions over variants, then highest popularity & year.
+    """
+    # The ordering was resolved for every row at build time; see _match_ranks.
+    return int(candidates[np.argmin(indexes["match_rank"][candidates])])
@@ -4,18 +4,32 @@ import ast
 import hashlib
 import json
 import logging
+import multiprocessing
+import os
 import tempfile
-from collections import defaultdict
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
-
-from utils.matcher import canon_artist_primary, canon_title
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from pandas._libs.parsers import STR_NA_VALUES
+
+from utils.matcher import (
+    INDEX_SCHEMA_VERSION,
+    _literal_string_list,
+    build_indexes,
+    canon_artist_primary,
+    canon_title,
+    load_indexes,
+    save_indexes,
+)
 
 logger = logging.getLogger(__name__)
-MERGE_SCHEMA_VERSION = 3
-ARTIST_SCAN_CHUNK_SIZE = 100_000
+MERGE_SCHEMA_VERSION = 4
 
 # === Audio feature list ===
 AUDIO_FEATURES = [
@@ -74,6 +88,50 @@ def _auto_columns(df: pd.DataFrame) -> dict[str, str | None]:
     }
 
 
+# === CSV loading ===
+
+
+# pyarrow parses a block per thread; larger blocks than its 1 MiB default keep
+# threads busy on multi-hundred-megabyte sources without inflating small reads.
+CSV_BLOCK_SIZE = 16 << 20
+
+
+def _read_csv_arrow(path: str, usecols: list[str] | None) -> pd.DataFrame:
+    """pd.read_csv(path, engine="pyarrow", usecols=usecols) with a larger block size."""
+    table = pacsv.read_csv(
+        path,
+        read_options=pacsv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=usecols or [],
+            null_values=sorted(STR_NA_VALUES),
+            strings_can_be_null=True,
+        ),
+    )
+    # All-null columns load as float64 NaN, as they do through pandas.
+    schema = table.schema
+    for i, arrow_type in enumerate(schema.types):
+        if pa.types.is_null(arrow_type):
+            schema = schema.set(i, schema.field(i).with_type(pa.float64()))
+    return table.cast(schema).to_pandas()
+
+
+def _read_source_csv(path: str) -> pd.DataFrame:
+    """
+    Parse the columns of a source CSV that _auto_columns maps, with pyarrow's
+    multithreaded reader, falling back to the C parser for files pyarrow
+    rejects (e.g. ragged rows).
+    """
+    header = pd.read_csv(path, nrows=0).columns
+    mapped = set(_auto_columns(pd.DataFrame(columns=header)).values())
+    # Without any mapped column, keep every column so the row count survives.
+    usecols = [column for column in header if column in mapped] or None
+    try:
+        return _read_csv_arrow(path, usecols)
+    except pa.ArrowInvalid:
+        logger.warning("pyarrow could not parse %s; retrying with the C parser", path)
+        return pd.read_csv(path, usecols=usecols)
+
+
 # === Row normalization ===
 
 
@@ -96,10 +154,12 @@ def _parse_artists(
     if not text:
         return []
     if text.startswith("["):
-        try:
-            parsed = ast.literal_eval(text)
-        except (SyntaxError, ValueError):
-            parsed = None
+        parsed = _literal_string_list(text)
+        if parsed is None:
+            try:
+                parsed = ast.literal_eval(text)
+            except (SyntaxError, ValueError, TypeError, MemoryError, RecursionError):
+                parsed = None
         if isinstance(parsed, (list, tuple)):
             return [str(artist).strip() for artist in parsed if str(artist).strip()]
 
@@ -130,26 +190,19 @@ def _parse_artists(
     return [text]
 
 
-def _known_comma_artists(paths: list[str]) -> dict[tuple[str, ...], str]:
+def _known_comma_artists(frames: list[pd.DataFrame]) -> dict[tuple[str, ...], str]:
     """Index comma-bearing names from unambiguous artist columns."""
     known: dict[tuple[str, ...], str] = {}
-    for path in paths:
-        columns = pd.read_csv(path, nrows=0).columns
-        artist_column = _auto_columns(pd.DataFrame(columns=columns))["artists"]
+    for df in frames:
+        artist_column = _auto_columns(df)["artists"]
         if artist_column is None or artist_column.lower() == "artist_names":
             continue
 
-        chunks = pd.read_csv(
-            path,
-            usecols=[artist_column],
-            chunksize=ARTIST_SCAN_CHUNK_SIZE,
-        )
-        for chunk in chunks:
-            for value in chunk[artist_column].dropna().drop_duplicates():
-                for artist in _parse_artists(value, artist_column):
-                    tokens = _artist_tokens(artist)
-                    if len(tokens) > 1:
-                        known.setdefault(tokens, artist)
+        for value in df[artist_column].dropna().drop_duplicates():
+            for artist in _parse_artists(value, artist_column):
+                tokens = _artist_tokens(artist)
+                if len(tokens) > 1:
+                    known.setdefault(tokens, artist)
     return known
 
 
@@ -169,227 +222,413 @@ def _parse_bool(value: Any) -> bool | None:
     return None
 
 
-def _normalize_row(
-    r: pd.Series,
-    colmap: dict[str, str | None],
-    known_comma_artists: dict[tuple[str, ...], str] | None = None,
-) -> dict[str, Any]:
-    """
-    Normalize one raw row into the canonical schema + audio features.
-    """
+UNIT_RANGE_FEATURES = frozenset(
+    {
+        "danceability",
+        "energy",
+        "valence",
+        "speechiness",
+        "acousticness",
+        "instrumentalness",
+        "liveness",
+    }
+)
+INTEGER_FEATURES = frozenset({"key", "mode"})
 
-    # artists to list[str]
-    artists_raw = _parse_artists(
-        r.get(colmap["artists"]),
-        colmap["artists"],
-        known_comma_artists,
+
+def _parse_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError, OverflowError):
+        return np.nan
+
+
+def _parse_int(value: Any) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def _parse_year(value: Any) -> int | None:
+    return _parse_int(str(value)[:4])
+
+
+def _map_unique(values: pd.Series, parse) -> list:
+    """Apply ``parse`` once per distinct non-missing value; missing values map to None."""
+    codes, uniques = pd.factorize(values)
+    parsed = np.array([*map(parse, uniques), None], dtype=object)
+    return parsed[codes].tolist()
+
+
+def _optional_values(values: np.ndarray, valid: np.ndarray) -> list:
+    """Python scalars from ``values`` where ``valid``, None elsewhere."""
+    out = np.full(len(values), None, dtype=object)
+    out[valid] = values[valid].tolist()
+    return out.tolist()
+
+
+def _float_values(values: pd.Series) -> np.ndarray:
+    """Parse a column as float64, with NaN for missing or unparseable values."""
+    if pd.api.types.is_numeric_dtype(values.dtype):
+        return values.to_numpy(dtype=np.float64, na_value=np.nan)
+    return np.array(
+        [np.nan if value is None else value for value in _map_unique(values, _parse_float)],
+        dtype=np.float64,
+    )
+
+
+def _int_values(values: pd.Series) -> list[int | None]:
+    """Parse a column like int(value), with None for missing or unparseable values."""
+    if not pd.api.types.is_numeric_dtype(values.dtype):
+        return _map_unique(values, _parse_int)
+    floats = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = np.isfinite(floats) & (np.abs(floats) < 2.0**63)
+    return _optional_values(
+        np.trunc(floats, where=valid, out=np.zeros_like(floats)).astype(np.int64), valid
     )
 
+
+def _feature_values(values: pd.Series, feat: str) -> list:
+    """Coerce one audio feature column, clamping unit-range features to [0, 1]."""
+    if feat in INTEGER_FEATURES:
+        return _int_values(values)
+    floats = _float_values(values)
+    valid = ~np.isnan(floats)
+    if feat in UNIT_RANGE_FEATURES:
+        floats = np.clip(floats, 0.0, 1.0)
+    elif feat == "tempo":
+        valid &= floats > 0
+    return _optional_values(floats, valid)
+
+
+TEXT_FIELDS = ("id", "name", "isrc", "album")
+# Output columns of _normalize_text, in order.
+TEXT_COLUMNS = ("spotify_id", "title_raw", "title_canon", "isrc", "album")
+
+
+def _normalize_text(raw_id: Any, raw_title: Any, raw_isrc: Any, raw_album: Any) -> tuple:
+    """Normalize the identifier and free-text fields (TEXT_FIELDS) of one raw row."""
+
     # id normalize
-    raw_id = r.get(colmap["id"])
     sid = str(raw_id).strip() if raw_id is not None and pd.notna(raw_id) else None
     sid = sid or None
     if sid and ":" in sid:
         sid = sid.split(":")[-1]
 
     # title canon
-    raw_title = r.get(colmap["name"], "")
     title_raw = "" if raw_title is None or pd.isna(raw_title) else str(raw_title).strip()
     tc = canon_title(title_raw)
     title_canon = tc[0] if isinstance(tc, tuple) else tc
 
-    # artist canon
-    artist_primary = canon_artist_primary(artists_raw)
+    return (
+        sid,
+        title_raw,
+        title_canon,
+        str(raw_isrc) if pd.notnull(raw_isrc) else None,
+        str(raw_album) if pd.notnull(raw_album) else None,
+    )
+
 
-    # duration
-    dur = r.get(colmap["duration"])
+def _artist_values(
+    values: pd.Series,
+    source_column: str | None,
+    known_comma_artists: dict[tuple[str, ...], str] | None = None,
+) -> tuple[list[list[str]], list[str]]:
+    """
+    Parse an artists column into (artists_raw, artist_primary_canon) lists,
+    once per distinct raw value; catalogs repeat each artist across many tracks.
+    """
     try:
-        duration_ms = int(dur) if pd.notnull(dur) else None
-    except (TypeError, ValueError, OverflowError):
-        duration_ms = None
-
-    # explicit
-    explicit = _parse_bool(r.get(colmap["explicit"])) if colmap["explicit"] else None
-
-    # popularity
-    popularity = None
-    if colmap["popularity"] is not None and pd.notnull(r.get(colmap["popularity"])):
-        try:
-            popularity = int(r.get(colmap["popularity"]))
-        except (TypeError, ValueError, OverflowError):
-            popularity = None
-
-    # release year
-    release_year = None
-    if colmap["release_year"] is not None and pd.notnull(r.get(colmap["release_year"])):
-        try:
-            release_year = int(str(r.get(colmap["release_year"]))[:4])
-        except (TypeError, ValueError, OverflowError):
-            release_year = None
-
-    # isrc / album
-    isrc = (
-        str(r.get(colmap["isrc"])) if colmap["isrc"] and pd.notnull(r.get(colmap["isrc"])) else None
-    )
-    album = (
-        str(r.get(colmap["album"]))
-        if colmap["album"] and pd.notnull(r.get(colmap["album"]))
-        else None
-    )
+        codes, uniques = pd.factorize(values)
+    except TypeError:
+        # Unhashable list values; parse each row.
+        codes, uniques = np.arange(len(values)), values.tolist()
+    # Missing values take code -1, which selects the appended empty parse.
+    parsed = [*(_parse_artists(v, source_column, known_comma_artists) for v in uniques), []]
+    primary = np.array([canon_artist_primary(artists) for artists in parsed], dtype=object)
+    # Each row gets its own list so rows never alias one another.
+    return [list(parsed[code]) for code in codes], primary[codes].tolist()
+
+
+def _normalize_frame(
+    df: pd.DataFrame,
+    colmap: dict[str, str | None],
+    known_comma_artists: dict[tuple[str, ...], str] | None = None,
+) -> pd.DataFrame:
+    """
+    Normalize every raw row into the canonical schema + audio features, as an
+    object-dtype frame of MERGED_COLUMNS holding Python values (None if missing).
 
-    # audio features
-    feats: dict[str, Any] = {}
-    for feat in AUDIO_FEATURES:
-        col = colmap.get(feat)
-        if not col:
-            feats[feat] = None
-            continue
-        val = r.get(col)
-        if pd.isnull(val):
-            feats[feat] = None
-            continue
-        try:
-            if feat in {
-                "danceability",
-                "energy",
-                "valence",
-                "speechiness",
-                "acousticness",
-                "instrumentalness",
-                "liveness",
-            }:
-                v = float(val)
-                feats[feat] = max(0.0, min(1.0, v))  # clamp
-            elif feat == "loudness":
-                feats[feat] = float(val)
-            elif feat == "tempo":
-                v = float(val)
-                feats[feat] = v if v > 0 else None
-            elif feat in {"key", "mode"}:
-                feats[feat] = int(val)
-            else:
-                feats[feat] = float(val)
-        except (TypeError, ValueError, OverflowError):
-            feats[feat] = None
+    Numeric fields are coerced a column at a time and artists are parsed once
+    per distinct value; only identifiers and titles are handled per row.
+    """
 
-    return {
-        "spotify_id": sid,
-        "title_raw": title_raw,
-        "title_canon": title_canon,
-        "artists_raw": artists_raw,
-        "artist_primary_canon": artist_primary,
-        "duration_ms": duration_ms,
-        "explicit": explicit,
-        "popularity": popularity,
-        "release_year": release_year,
-        "isrc": isrc,
-        "album": album,
-        **feats,
+    def parsed(column: str | None, parse) -> list:
+        return parse(df[column]) if column else [None] * len(df)
+
+    numeric = {
+        "duration_ms": parsed(colmap["duration"], _int_values),
+        "explicit": parsed(colmap["explicit"], lambda values: _map_unique(values, _parse_bool)),
+        "popularity": parsed(colmap["popularity"], _int_values),
+        "release_year": parsed(
+            colmap["release_year"], lambda values: _map_unique(values, _parse_year)
+        ),
+        **{
+            feat: parsed(colmap.get(feat), lambda values, feat=feat: _feature_values(values, feat))
+            for feat in AUDIO_FEATURES
+        },
     }
 
+    # Free-text columns are converted to Python lists once and zipped, so the
+    # row loop makes no Series (as iterrows did) and no per-row colmap lookups.
+    text = [
+        df[colmap[field]].tolist() if colmap[field] else [None] * len(df) for field in TEXT_FIELDS
+    ]
+    normalized = [_normalize_text(*texts) for texts in zip(*text, strict=True)]
+    columns = {column: [row[i] for row in normalized] for i, column in enumerate(TEXT_COLUMNS)}
+    artist_column = colmap["artists"]
+    if artist_column:
+        columns["artists_raw"], columns["artist_primary_canon"] = _artist_values(
+            df[artist_column], artist_column, known_comma_artists
+        )
+    else:
+        columns["artists_raw"] = [[] for _ in range(len(df))]
+        columns["artist_primary_canon"] = [""] * len(df)
+    return pd.DataFrame({**columns, **numeric}, columns=MERGED_COLUMNS, dtype=object)
+
+
+def _normalize_row(
+    r,
+    colmap: dict[str, str | None],
+    known_comma_artists: dict[tuple[str, ...], str] | None = None,
+) -> dict[str, Any]:
+    """
+    Normalize one raw row (a Series or mapping) into the canonical schema + audio features.
+    """
+    # Mapped columns absent from the row read as missing, as r.get() did.
+    columns = list(dict.fromkeys(column for column in colmap.values() if column))
+    frame = pd.DataFrame([r]).reindex(columns=columns)
+    return _normalize_frame(frame, colmap, known_comma_artists).iloc[0].to_dict()
+
 
 # === Field-wise merge ===
 
+MERGED_COLUMNS = [
+    "spotify_id",
+    "title_raw",
+    "title_canon",
+    "artists_raw",
+    "artist_primary_canon",
+    "duration_ms",
+    "explicit",
+    "popularity",
+    "release_year",
+    "isrc",
+    "album",
+    *AUDIO_FEATURES,
+]
+
 
-def _coalesce(a, b):
-    if a in (None, "", [], {}):
-        return b
-    if b in (None, "", [], {}):
-        return a
-    if isinstance(a, str) and isinstance(b, str):
-        return a if len(a) >= len(b) else b
-    if isinstance(a, list) and isinstance(b, list):
-        return a if len(a) >= len(b) else b
-    return a
+def _is_empty(value: Any) -> bool:
+    return value is None or (isinstance(value, (str, list, dict)) and not value)
 
 
-def _merge_two_rows(x: dict[str, Any], y: dict[str, Any]) -> dict[str, Any]:
-    out = dict(x)
-    for k in ["spotify_id", "isrc"]:
-        out[k] = out.get(k) or y.get(k)
+def _group_choice(codes: np.ndarray, eligible: np.ndarray, fallback: np.ndarray) -> np.ndarray:
+    """
+    Per group (ascending code order), the position of its first ``eligible``
+    row, or the group's ``fallback`` position when none is eligible.
+    """
+    chosen = fallback.copy()
+    positions = np.flatnonzero(eligible)
+    groups, first = np.unique(codes[positions], return_index=True)
+    chosen[groups] = positions[first]
+    return chosen
+
 
-    out["title_raw"] = _coalesce(out.get("title_raw"), y.get("title_raw"))
-    out["artists_raw"] = _coalesce(out.get("artists_raw"), y.get("artists_raw"))
-    out["album"] = _coalesce(out.get("album"), y.get("album"))
+def _merge_groups(rows: pd.DataFrame, codes: np.ndarray) -> pd.DataFrame:
+    """
+    Merge each group of ``rows`` (labelled by dense ``codes`` in order of first
+    appearance) into one row, as folding _merge_two_rows over the group in row
+    order would.
+    """
+    n_groups = int(codes.max()) + 1 if len(codes) else 0
+    last = np.full(n_groups, -1, dtype=np.int64)
+    np.maximum.at(last, codes, np.arange(len(rows)))
+    # Position -1 selects the None appended by take().
+    none = np.full(n_groups, -1, dtype=np.int64)
+
+    values = {column: rows[column].to_numpy(dtype=object) for column in MERGED_COLUMNS}
+
+    def take(column: str, chosen: np.ndarray) -> np.ndarray:
+        return np.append(values[column], None)[chosen]
+
+    def present(column: str) -> np.ndarray:
+        return pd.notna(values[column])
+
+    merged = {}
+
+    # IDs: first truthy value, else the last row's.
+    for column in ("spotify_id", "isrc"):
+        truthy = np.fromiter(map(bool, values[column]), dtype=bool, count=len(rows))
+        merged[column] = take(column, _group_choice(codes, truthy, last))
+
+    # Metadata: the earliest of the longest non-empty values, else the last row's.
+    for column in ("title_raw", "artists_raw", "album"):
+        lengths = np.fromiter(
+            (0 if _is_empty(value) else len(value) for value in values[column]),
+            dtype=np.int64,
+            count=len(rows),
+        )
+        longest = np.zeros(n_groups, dtype=np.int64)
+        np.maximum.at(longest, codes, lengths)
+        eligible = (lengths > 0) & (lengths == longest[codes])
+        merged[column] = take(column, _group_choice(codes, eligible, last))
     # Canonical fields must describe the metadata selected above, not whichever
     # input row happened to initialize the merge bucket.
-    out["title_canon"] = canon_title(out.get("title_raw", ""))
-    out["artist_primary_canon"] = canon_artist_primary(out.get("artists_raw", []))
-
-    # popularity: take max
-    px, py = out.get("popularity"), y.get("popularity")
-    out["popularity"] = (
-        max(px, py) if (px is not None and py is not None) else (px if px is not None else py)
+    merged["title_canon"] = np.array(
+        [canon_title(title or "") for title in merged["title_raw"]], dtype=object
+    )
+    merged["artist_primary_canon"] = np.array(
+        [canon_artist_primary(artists or []) for artists in merged["artists_raw"]], dtype=object
     )
 
-    # explicit: True if any
-    ex, ey = out.get("explicit"), y.get("explicit")
-    out["explicit"] = bool(ex or ey) if (ex is not None or ey is not None) else None
-
-    # release_year: prefer newer
-    rx, ry = out.get("release_year"), y.get("release_year")
-    if rx is None:
-        out["release_year"] = ry
-    elif ry is None:
-        out["release_year"] = rx
-    else:
-        out["release_year"] = max(rx, ry)
-
-    # duration: prefer larger if within 2s
-    dx, dy = out.get("duration_ms"), y.get("duration_ms")
-    if dx is None:
-        out["duration_ms"] = dy
-    elif dy is None:
-        out["duration_ms"] = dx
-    else:
-        if abs(dx - dy) <= 2000:
-            out["duration_ms"] = max(dx, dy)
-        else:
-            out["duration_ms"] = dx
+    # popularity / release_year: max; explicit: True if any
+    for column in ("popularity", "release_year", "explicit"):
+        has_value = present(column)
+        numeric = np.where(has_value, values[column], -np.inf).astype(np.float64)
+        best = np.full(n_groups, -np.inf)
+        np.maximum.at(best, codes, numeric)
+        merged[column] = take(
+            column, _group_choice(codes, has_value & (numeric == best[codes]), none)
+        )
 
-    # audio features: keep existing if present, else take from y
+    # duration: prefer larger if within 2s of the value kept so far
+    has_duration = present("duration_ms")
+    merged["duration_ms"] = take("duration_ms", _group_choice(codes, has_duration, none))
+    with_duration = np.flatnonzero(has_duration)
+    order = with_duration[np.argsort(codes[with_duration], kind="stable")]
+    groups, starts, counts = np.unique(codes[order], return_index=True, return_counts=True)
+    for group, start, count in zip(groups, starts, counts, strict=True):
+        if count < 2:
+            continue
+        durations = values["duration_ms"][order[start : start + count]]
+        current = durations[0]
+        for duration in durations[1:]:
+            if abs(current - duration) <= 2000:
+                current = max(current, duration)
+        merged["duration_ms"][group] = current
+
+    # audio features: first present value
     for feat in AUDIO_FEATURES:
-        if out.get(feat) is None and y.get(feat) is not None:
-            out[feat] = y.get(feat)
+        merged[feat] = take(feat, _group_choice(codes, present(feat), none))
+
+    return pd.DataFrame({column: merged[column] for column in MERGED_COLUMNS}, dtype=object)
+
 
-    return out
+def _merge_two_rows(x: dict[str, Any], y: dict[str, Any]) -> dict[str, Any]:
+    """Merge two normalized rows describing the same track."""
+    rows = pd.DataFrame([x, y], columns=MERGED_COLUMNS, dtype=object)
+    rows = rows.where(rows.notna(), None)
+    return _merge_groups(rows, np.zeros(2, dtype=np.int64)).iloc[0].to_dict()
 
 
 # === Dedupe passes ===
 
 
-def _dedupe_by_key(rows: list[dict[str, Any]], key_fn) -> list[dict[str, Any]]:
-    buckets = defaultdict(list)
-    for r in rows:
-        k = key_fn(r)
-        if k is not None:
-            buckets[k].append(r)
+def _dedupe_frame(df: pd.DataFrame, keys: pd.DataFrame, valid: np.ndarray) -> pd.DataFrame:
+    """
+    Merge rows of ``df`` that share a key. Keyed rows come first, in order of
+    each key's first appearance, followed by the rows whose key is not
+    ``valid`` in their original order.
+    """
+    positions = np.flatnonzero(valid)
+    codes = (
+        keys.iloc[positions]
+        .groupby(list(keys.columns), sort=False)
+        .ngroup()
+        .to_numpy(dtype=np.int64)
+    )
+    if len(codes) == 0:
+        return df.reset_index(drop=True)
+    sizes = np.bincount(codes)
+    multi = sizes[codes] > 1
+
+    multi_codes = codes[multi]
+    dense = np.unique(multi_codes, return_inverse=True)[1]
+    merged = _merge_groups(df.iloc[positions[multi]].reset_index(drop=True), dense)
+    singles = df.iloc[positions[~multi]].reset_index(drop=True)
+
+    keyed = pd.concat([singles, merged], ignore_index=True)
+    order = np.argsort(np.concatenate([codes[~multi], np.unique(multi_codes)]), kind="stable")
+    return pd.concat([keyed.iloc[order], df.iloc[np.flatnonzero(~valid)]], ignore_index=True)
+
+
+# Below this many source rows, worker start-up and pickling cost more than
+# normalizing the sources serially.
+PARALLEL_NORMALIZE_MIN_ROWS = 200_000
+
+
+def _normalize_source(
+    df: pd.DataFrame, known_comma_artists: dict[tuple[str, ...], str]
+) -> pd.DataFrame:
+    return _normalize_frame(df, _auto_columns(df), known_comma_artists)
+
+
+def _normalize_sources(
+    frames: list[pd.DataFrame],
+    known_comma_artists: dict[tuple[str, ...], str],
+    parallel: bool = False,
+) -> pd.DataFrame:
+    """
+    Normalize every source frame. With ``parallel``, large inputs use one
+    worker process per source.
+    """
+    if not frames:
+        return pd.DataFrame(columns=MERGED_COLUMNS, dtype=object)
+
+    workers = min(len(frames), os.cpu_count() or 1)
+    if not parallel or workers < 2 or sum(map(len, frames)) < PARALLEL_NORMALIZE_MIN_ROWS:
+        normalized = [_normalize_source(df, known_comma_artists) for df in frames]
+    else:
+        # Spawned workers never inherit a forked copy of the caller's threads
+        # and locks (the CSV reader pool above, or a web server's).
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            normalized = list(
+                executor.map(_normalize_source, frames, [known_comma_artists] * len(frames))
+            )
+    return pd.concat(normalized, ignore_index=True)
 
-    merged: list[dict[str, Any]] = []
-    seen = set()
-    for _, items in buckets.items():
-        base = items[0]
-        for other in items[1:]:
-            base = _merge_two_rows(base, other)
-        merged.append(base)
-        seen.update(id(x) for x in items)
 
-    for r in rows:
-        if id(r) not in seen:
-            merged.append(r)
-    return merged
+# Columns that identify a track in the final exact-duplicate sweep.
+FINAL_DEDUPE_COLUMNS = ("spotify_id", "isrc", "title_canon", "artist_primary_canon", "duration_ms")
+
+
+def _duration_buckets(durations: np.ndarray, width: int) -> np.ndarray:
+    """round(duration / width) for int64 durations, in exact integer arithmetic."""
+    quotient, remainder = np.divmod(durations, width)
+    # Round half to even, as round() does.
+    twice = 2 * remainder
+    return quotient + ((twice > width) | ((twice == width) & (quotient % 2 == 1)))
 
 
 # === Main merge ===
 
 
-def merge_datasets(paths: list[str], conservative_duration_ms: int = 3000) -> pd.DataFrame:
+def merge_datasets(
+    paths: list[str], conservative_duration_ms: int = 3000, parallel: bool = False
+) -> pd.DataFrame:
     """
     Load CSV datasets, normalize rows, and dedupe in three passes:
       1) by Spotify ID
       2) by ISRC
       3) by (title_canon, artist_primary_canon, duration bucket)
 
+    ``parallel`` lets large sources normalize in worker processes; only
+    command-line builds should set it.
+
     Returns
     -------
     DataFrame
@@ -398,47 +637,40 @@ def merge_datasets(paths: list[str], conservative_duration_ms: int = 3000) -> pd
     if conservative_duration_ms <= 0:
         raise ValueError("conservative_duration_ms must be greater than zero.")
 
-    known_comma_artists = _known_comma_artists(paths)
-    norm_rows: list[dict[str, Any]] = []
-    for p in paths:
-        df = pd.read_csv(p)
-        col = _auto_columns(df)
-        for _, r in df.iterrows():
-            norm_rows.append(_normalize_row(r, col, known_comma_artists))
-
-    rows = _dedupe_by_key(norm_rows, key_fn=lambda r: r["spotify_id"])
-    rows = _dedupe_by_key(rows, key_fn=lambda r: r["isrc"])
-
-    def key_canon_dur(r):
-        if not r["title_canon"] or not r["artist_primary_canon"] or r["duration_ms"] is None:
-            return None
-        bucket = round(r["duration_ms"] / conservative_duration_ms)
-        return (r["title_canon"], r["artist_primary_canon"], bucket)
-
-    rows = _dedupe_by_key(rows, key_fn=key_canon_dur)
-
-    out_df = pd.DataFrame(
-        rows,
-        columns=[
-            "spotify_id",
-            "title_raw",
-            "title_canon",
-            "artists_raw",
-            "artist_primary_canon",
-            "duration_ms",
-            "explicit",
-            "popularity",
-            "release_year",
-            "isrc",
-            "album",
-            *AUDIO_FEATURES,
-        ],
+    # Parsing is mostly native code that releases the GIL, so the sources load
+    # concurrently; each is read once and reused for the artist scan.
+    with ThreadPoolExecutor(max_workers=max(1, min(len(paths), os.cpu_count() or 1))) as executor:
+        frames = list(executor.map(_read_source_csv, paths))
+
+    known_comma_artists = _known_comma_artists(frames)
+    rows = _normalize_sources(frames, known_comma_artists, parallel)
+    for column in ("spotify_id", "isrc"):
+        rows = _dedupe_frame(rows, rows[[column]], rows[column].notna().to_numpy())
+
+    durations = rows["duration_ms"]
+    has_key = (
+        rows["title_canon"].astype(bool) & rows["artist_primary_canon"].astype(bool)
+    ).to_numpy() & durations.notna().to_numpy()
+    buckets = np.zeros(len(rows), dtype=np.int64)
+    buckets[has_key] = _duration_buckets(
+        durations[has_key].to_numpy(dtype=np.int64), conservative_duration_ms
+    )
+    # Group on integer codes rather than hashing (title, artist) strings again.
+    keys = pd.DataFrame(
+        {
+            "title": pd.factorize(rows["title_canon"])[0],
+            "artist": pd.factorize(rows["artist_primary_canon"])[0],
+            "bucket": buckets,
+        }
     )
+    rows = _dedupe_frame(rows, keys, has_key)
 
-    return out_df.drop_duplicates(
-        subset=["spotify_id", "isrc", "title_canon", "artist_primary_canon", "duration_ms"],
-        keep="first",
-    ).reset_index(drop=True)
+    # Rebuilt from Python values so dtypes are inferred as for a list of records.
+    out_df = pd.DataFrame({column: rows[column].tolist() for column in MERGED_COLUMNS})
+
+    # One int64 hash per row instead of a multi-column, mixed-dtype comparison.
+    fingerprints = pd.util.hash_pandas_object(out_df[list(FINAL_DEDUPE_COLUMNS)], index=False)
+    return out_df.loc[~fingerprints.duplicated(keep="first").to_numpy()].reset_index(drop=True)
 
 
 # === Cache wrapper ===
@@ -450,52 +682,185 @@ def _fingerprint_inputs(paths: list[str]) -> str:
     """
     items = []
     for p in paths:
-        stat = Path(p).stat()
-        items.append(
-            {
-                "path": str(Path(p).resolve()),
-                "size": stat.st_size,
-                "mtime_ns": stat.st_mtime_ns,
-            }
-        )
-    fingerprint_payload = {
-        "merge_schema_version": MERGE_SCHEMA_VERSION,
-        "inputs": sorted(items, key=lambda item: item["path"]),
-    }
-    blob = json.dumps(fingerprint_payload, separators=(",", ":")).encode()
-    return hashlib.sha256(blob).hexdigest()[:16]
+        stat = os.stat(p)
+        items.append(f"{Path(p).resolve()}|{stat.st_size}|{stat.st_mtime_ns}\n")
+    digest = hashlib.blake2b(f"v{MERGE_SCHEMA_VERSION}\n".encode(), digest_size=8)
+    for item in sorted(items):
+        digest.update(item.encode())
+    return digest.hexdigest()
 
 
-def get_merged_dataset(
-    paths: list[str], cache_dir: str = ".dataset_cache", force_rebuild: bool = False
-) -> pd.DataFrame:
-    """
-    Get the merged dataset, using a cached Parquet file if available.
-    The web app queries this Parquet cache directly through DuckDB.
-    """
-    Path(cache_dir).mkdir(parents=True, exist_ok=True)
-    fp = _fingerprint_inputs(paths)
-    target = Path(cache_dir) / f"merged_{fp}.parquet"
-
-    if target.exists() and not force_rebuild:
-        logger.info("Using cached merged dataset %s", target.name)
-        return pd.read_parquet(target)
-
-    logger.info("Rebuilding merged dataset cache")
-    df = merge_datasets(paths)
+def _write_atomically(target: Path, suffix: str, write) -> None:
+    """Write through a sibling temporary file so readers never see partial caches."""
     temporary_path: Path | None = None
     try:
         with tempfile.NamedTemporaryFile(
             dir=target.parent,
             prefix=f".{target.stem}-",
-            suffix=".tmp.parquet",
+            suffix=suffix,
             delete=False,
         ) as temporary:
             temporary_path = Path(temporary.name)
-        df.to_parquet(temporary_path, index=False)
+        write(temporary_path)
         temporary_path.replace(target)
     finally:
         if temporary_path is not None:
             temporary_path.unlink(missing_ok=True)
 
+
+# Matches the deployment catalog's ZSTD, DuckDB-sized row groups; the web app
+# queries this cache through DuckDB as well.
+MERGED_PARQUET_OPTIONS = {
+    "index": False,
+    "compression": "zstd",
+    "compression_level": 3,
+    "row_group_size": 122_880,
+}
+
+# Stored as categoricals: ID filters and artist exclusions compare integer
+# codes, and repeated canonical strings are held once per catalog.
+CATEGORICAL_COLUMNS = ("spotify_id", "title_canon", "artist_primary_canon")
+
+
+def _categorize_keys(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast CATEGORICAL_COLUMNS to categoricals where they are not already."""
+    for column in CATEGORICAL_COLUMNS:
+        if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype("category")
     return df
+
+
+# List-valued; artist_primary_canon is derived from it and is hashed instead.
+_UNHASHED_COLUMNS = ("artists_raw",)
+
+
+def _catalog_content_key(df: pd.DataFrame) -> str:
+    """Hash of the catalog's scalar columns, row order included."""
+    columns = [column for column in df.columns if column not in _UNHASHED_COLUMNS]
+    digest = hashlib.blake2b(json.dumps([str(c) for c in columns]).encode(), digest_size=8)
+    digest.update(str(len(df)).encode())
+    for column in columns:
+        digest.update(pd.util.hash_pandas_object(df[column], index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+# Frames returned by get_merged_dataset, by id(), with a content key and their
+# cache directory. pandas copies DataFrame.attrs onto sorted, filtered, and
+# assigned frames of the same length, so attrs cannot tell a loaded catalog from
+# a frame derived from it; a registration never transfers to another object.
+_LOADED_CATALOGS: dict[int, tuple[weakref.ref, str, str]] = {}
+
+
+def _register_catalog(df: pd.DataFrame, cache_dir: str | Path) -> None:
+    key = id(df)
+
+    def forget(ref: weakref.ref) -> None:
+        if _LOADED_CATALOGS.get(key, (None,))[0] is ref:
+            del _LOADED_CATALOGS[key]
+
+    _LOADED_CATALOGS[key] = (weakref.ref(df, forget), _catalog_content_key(df), str(cache_dir))
+
+
+def _loaded_catalog_identity(df: pd.DataFrame) -> tuple[str, str] | None:
+    """(content key, cache directory) of a get_merged_dataset frame, else None."""
+    entry = _LOADED_CATALOGS.get(id(df))
+    if entry is None or entry[0]() is not df:
+        return None
+    return entry[1], entry[2]
+
+
+def get_merged_dataset(
+    paths: list[str],
+    cache_dir: str = ".dataset_cache",
+    force_rebuild: bool = False,
+    parallel: bool = False,
+) -> pd.DataFrame:
+    """
+    Get the merged dataset, using a cached Parquet file if available.
+    The web app queries this Parquet cache directly through DuckDB.
+    ``parallel`` is passed to merge_datasets on a rebuild.
+
+    Artifacts cached for the returned frame (scalers, PCA fits, embeddings,
+    matcher indexes) are keyed by its content at load; modify a copy rather
+    than the frame itself.
+    """
+    Path(cache_dir).mkdir(parents=True, exist_ok=True)
+    fp = _fingerprint_inputs(paths)
+    target = Path(cache_dir) / f"merged_{fp}.parquet"
+
+    if target.exists() and not force_rebuild:
+        logger.info("Using cached merged dataset %s", target.name)
+        # Caches written before keys were persisted as categoricals load as strings.
+        df = _categorize_keys(pd.read_parquet(target))
+    else:
+        logger.info("Rebuilding merged dataset cache")
+        df = _categorize_keys(merge_datasets(paths, parallel=parallel))
+        _write_atomically(
+            target, ".tmp.parquet", lambda path: df.to_parquet(path, **MERGED_PARQUET_OPTIONS)
+        )
+
+    # Registry entry that downstream caches (fitted scalers, PCA fits,
+    # embeddings, matcher indexes) key their artifacts by.
+    _register_catalog(df, cache_dir)
+    return df
+
+
+# Columns build_indexes reads; canonical columns make their raw sources redundant.
+_INDEX_INPUT_COLUMNS = (
+    "spotify_id",
+    "title_raw",
+    "title_canon",
+    "artist_primary_canon",
+    "duration_ms",
+    "popularity",
+    "release_year",
+)
+
+
+def _index_fingerprint(catalog_df: pd.DataFrame) -> str:
+    """
+    Cache key for the indexes of ``catalog_df``: the content key of a frame
+    returned by get_merged_dataset, otherwise a hash of the columns
+    build_indexes reads. Both follow row order, which the indexes store.
+    """
+    identity = _loaded_catalog_identity(catalog_df)
+    if identity is not None:
+        return identity[0]
+
+    columns = [column for column in _INDEX_INPUT_COLUMNS if column in catalog_df.columns]
+    if "artist_primary_canon" not in catalog_df.columns and "artists_raw" in catalog_df.columns:
+        columns.append("artists_raw")
+    digest = hashlib.blake2b(json.dumps(columns).encode(), digest_size=8)
+    digest.update(str(len(catalog_df)).encode())
+    for column in columns:
+        values = catalog_df[column]
+        if values.dtype == object:
+            # Lists (e.g. artists_raw) are unhashable; their repr is stable.
+            values = values.map(lambda value: value if isinstance(value, str) else repr(value))
+        digest.update(pd.util.hash_pandas_object(values, index=False).to_numpy().tobytes())
+    return f"c{digest.hexdigest()}"
+
+
+def get_catalog_indexes(
+    catalog_df: pd.DataFrame,
+    cache_dir: str = ".dataset_cache",
+    force_rebuild: bool = False,
+    parallel: bool = False,
+) -> dict:
+    """
+    Get matcher indexes for ``catalog_df``, caching them as an ``.npz`` in
+    ``cache_dir`` under the frame's content and row order so repeat runs skip
+    the index build. ``parallel`` is passed to build_indexes on a rebuild.
+    """
+    Path(cache_dir).mkdir(parents=True, exist_ok=True)
+    fp = _index_fingerprint(catalog_df)
+    target = Path(cache_dir) / f"indexes_{fp}-v{INDEX_SCHEMA_VERSION}.npz"
+
+    if target.exists() and not force_rebuild:
+        logger.info("Using cached matcher indexes %s", target.name)
+        return load_indexes(target)
+
+    logger.info("Rebuilding matcher index cache")
+    indexes = build_indexes(catalog_df, parallel=parallel)
+    _write_atomically(target, ".tmp.npz", lambda path: save_indexes(indexes, path))
+    return indexes
@@ -2,15 +2,26 @@
 
 import logging
 import re
+import threading
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 from spotipy import Spotify
 
-from utils.matcher import canon_artist_primary, canon_title, match_track
+from utils.matcher import canon_artist_primary, canon_title, match_position
 
 logger = logging.getLogger(__name__)
 
+# Largest page the playlist items endpoint accepts, and how many pages after
+# the first are requested at once.
+PLAYLIST_PAGE_SIZE = 50
+PLAYLIST_PAGE_WORKERS = 8
+
+_PLAYLIST_URL_RE = re.compile(r"playlist/([a-zA-Z0-9]+)")
+_PLAYLIST_URI_RE = re.compile(r"spotify:playlist:([a-zA-Z0-9]+)")
+_PLAYLIST_ID_RE = re.compile(r"[a-zA-Z0-9]+")
+
 MEMBERSHIP_COLUMNS = [
     "playlist_id",
     "position",
@@ -26,28 +37,86 @@ def extract_playlist_id(url_or_uri: str) -> str:
     """
     Extract a Spotify playlist ID from a full URL, URI, or raw ID string.
     """
-    m = re.search(r"playlist/([a-zA-Z0-9]+)", url_or_uri)
-    if m:
-        return m.group(1)
-    m = re.search(r"spotify:playlist:([a-zA-Z0-9]+)", url_or_uri)
+    if _PLAYLIST_ID_RE.fullmatch(url_or_uri):
+        return url_or_uri
+    m = _PLAYLIST_URL_RE.search(url_or_uri) or _PLAYLIST_URI_RE.search(url_or_uri)
     if m:
         return m.group(1)
-    if re.fullmatch(r"[a-zA-Z0-9]+", url_or_uri):
-        return url_or_uri
     raise ValueError(f"Invalid Spotify playlist link/URI: {url_or_uri}")
 
 
+def _page_client(sp: Spotify, access_token: str | None) -> Spotify:
+    """
+    A client for one page worker, with its own HTTP session and a fixed copy of
+    the caller's access token. requests.Session is not documented as
+    thread-safe, and a token refresh through a shared auth manager would write
+    to its cache handler from several threads at once. Other client objects
+    (e.g. test doubles) are shared as given.
+    """
+    if not isinstance(sp, Spotify):
+        return sp
+    return Spotify(
+        auth=access_token,
+        proxies=sp.proxies,
+        requests_timeout=sp.requests_timeout,
+        status_forcelist=sp.status_forcelist,
+        retries=sp.retries,
+        status_retries=sp.status_retries,
+        backoff_factor=sp.backoff_factor,
+        language=sp.language,
+    )
+
+
+def _playlist_pages(sp: Spotify, playlist_id: str) -> Iterator[dict]:
+    """Yield the playlist item pages in order, fetching pages after the first concurrently."""
+    path = f"playlists/{playlist_id}/items"
+    # Spotify renamed the Development Mode endpoint from /tracks to /items in
+    # 2026. Spotipy versions that still target /tracks cannot use the new API.
+    results = sp._get(path, limit=PLAYLIST_PAGE_SIZE, additional_types="track")
+    if not results:
+        return
+    yield results
+
+    total = results.get("total")
+    if not results.get("next"):
+        return
+    if not isinstance(total, int):
+        # Without a total the remaining offsets are unknown; follow the links.
+        while results.get("next"):
+            results = sp.next(results)
+            if not results:
+                return
+            yield results
+        return
+
+    offsets = range(PLAYLIST_PAGE_SIZE, total, PLAYLIST_PAGE_SIZE)
+    workers = max(1, min(PLAYLIST_PAGE_WORKERS, len(offsets)))
+    # Resolve (and, if due, refresh) the token once here, on the caller's thread;
+    # the workers only read their copy of it.
+    access_token = None
+    if isinstance(sp, Spotify):
+        access_token = sp._auth_headers().get("Authorization", "").removeprefix("Bearer ") or None
+    clients = threading.local()
+
+    def fetch(offset: int) -> dict:
+        client = getattr(clients, "client", None)
+        if client is None:
+            client = clients.client = _page_client(sp, access_token)
+        return client._get(path, limit=PLAYLIST_PAGE_SIZE, offset=offset, additional_types="track")
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pages = executor.map(fetch, offsets)
+        for page in pages:
+            # Like the link-following path, an empty response ends the playlist.
+            if not page:
+                return
+            yield page
+
+
 def _iter_playlist_tracks(sp: Spotify, playlist_id: str) -> Iterator[tuple[int, dict]]:
     """Yield Spotify track objects with their zero-based playlist positions."""
     position = 0
-    # Spotify renamed the Development Mode endpoint from /tracks to /items in
-    # 2026. Spotipy versions that still target /tracks cannot use the new API.
-    results = sp._get(
-        f"playlists/{playlist_id}/items",
-        limit=50,
-        additional_types="track",
-    )
-    while results:
+    for results in _playlist_pages(sp, playlist_id):
         for item in results["items"]:
             # New responses use `item`; tolerate the former shape for Extended
             # Quota apps and older test fixtures.
@@ -57,16 +126,20 @@ def _iter_playlist_tracks(sp: Spotify, playlist_id: str) -> Iterator[tuple[int,
             if track:
                 yield current_position, track
 
-        results = sp.next(results) if results.get("next") else None
 
-
-def _match_catalog_track(track, indexes=None, catalog_df=None, catalog_store=None):
-    """Match a Spotify track using the deployment store or legacy DataFrame path."""
+def _match_catalog_tracks(
+    tracks: list[dict], indexes=None, catalog_df=None, catalog_store=None
+) -> list[dict | None]:
+    """Match Spotify tracks using the deployment store or legacy DataFrame path."""
     if catalog_store is not None:
-        return catalog_store.match_track(track)
+        return [catalog_store.match_track(track) for track in tracks]
     if indexes is None or catalog_df is None:
         raise ValueError("Provide catalog_store or both indexes and catalog_df.")
-    return match_track(track, indexes, catalog_df)
+
+    # Resolve positions from the indexes, then read every matched row in one take.
+    positions = [match_position(track, indexes) for track in tracks]
+    records = iter(catalog_df.iloc[[p for p in positions if p is not None]].to_dict("records"))
+    return [None if position is None else next(records) for position in positions]
 
 
 def _source_track_identity(track: dict, position: int) -> tuple:
@@ -88,6 +161,24 @@ def _source_track_identity(track: dict, position: int) -> tuple:
     return ("position", position)
 
 
+def _unique_playlist_tracks(sp: Spotify, playlist_id: str) -> tuple[list[tuple[int, dict]], int]:
+    """
+    Return each distinct source track with its first playlist position, plus the
+    total number of source tracks.
+    """
+    unique_tracks = []
+    seen_tracks = set()
+    total_source_tracks = 0
+    for position, track in _iter_playlist_tracks(sp, playlist_id):
+        total_source_tracks += 1
+        identity = _source_track_identity(track, position)
+        if identity in seen_tracks:
+            continue
+        seen_tracks.add(identity)
+        unique_tracks.append((position, track))
+    return unique_tracks, total_source_tracks
+
+
 def fetch_playlist_membership(
     sp: Spotify,
     playlist_id: str,
@@ -103,17 +194,16 @@ def fetch_playlist_membership(
     playlist position. Catalog fallback matches retain both the source Spotify ID
     and the matched catalog Spotify ID so the match ceiling remains auditable.
     """
-    rows = []
-    seen_tracks = set()
-    total_source_tracks = 0
-
-    for position, track in _iter_playlist_tracks(sp, playlist_id):
-        total_source_tracks += 1
-        identity = _source_track_identity(track, position)
-        if identity in seen_tracks:
-            continue
-        seen_tracks.add(identity)
+    unique_tracks, total_source_tracks = _unique_playlist_tracks(sp, playlist_id)
+    matches = _match_catalog_tracks(
+        [track for _, track in unique_tracks],
+        indexes=indexes,
+        catalog_df=catalog_df,
+        catalog_store=catalog_store,
+    )
 
+    rows = []
+    for (position, track), match in zip(unique_tracks, matches, strict=True):
         source_spotify_id = track.get("id")
         source_spotify_id = str(source_spotify_id) if source_spotify_id else None
         artist_names = [
@@ -121,12 +211,6 @@ def fetch_playlist_membership(
             for artist in (track.get("artists") or [])
             if isinstance(artist, dict) and artist.get("name")
         ]
-        match = _match_catalog_track(
-            track,
-            indexes=indexes,
-            catalog_df=catalog_df,
-            catalog_store=catalog_store,
-        )
         catalog_spotify_id = match.get("spotify_id") if match is not None else None
         if pd.isna(catalog_spotify_id):
             catalog_spotify_id = None
@@ -178,23 +262,14 @@ def fetch_playlist_profile(
     the catalog using prebuilt indexes + DataFrame.
     Returns a DataFrame of matched rows (with features).
     """
-    matched_rows = []
-    seen_tracks = set()
-    total_tracks = 0
-    for position, track in _iter_playlist_tracks(sp, playlist_id):
-        total_tracks += 1
-        identity = _source_track_identity(track, position)
-        if identity in seen_tracks:
-            continue
-        seen_tracks.add(identity)
-        match = _match_catalog_track(
-            track,
-            indexes=indexes,
-            catalog_df=catalog_df,
-            catalog_store=catalog_store,
-        )
-        if match is not None:
-            matched_rows.append(match)
+    unique_tracks, total_tracks = _unique_playlist_tracks(sp, playlist_id)
+    matches = _match_catalog_tracks(
+        [track for _, track in unique_tracks],
+        indexes=indexes,
+        catalog_df=catalog_df,
+        catalog_store=catalog_store,
+    )
+    matched_rows = [match for match in matches if match is not None]
 
     stats = {"total_tracks": total_tracks, "matched_tracks": len(matched_rows)}
     if not matched_rows:
@@ -7,6 +7,7 @@ import logging
 import os
 import sys
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -35,6 +36,9 @@ from webapp.errors import (
 )
 
 CATALOG_MANIFEST_PATH = ROOT_DIR / "data" / "catalog" / "CURRENT"
+# Concurrent single-track album art requests; the batch tracks endpoint is
+# not available to current Spotify apps.
+ALBUM_ART_WORKERS = 8
 logger = logging.getLogger(__name__)
 
 
@@ -162,22 +166,32 @@ def generate_recommendations(
     )
 
 
+def _fetch_album_art_url(sp, spotify_id: str) -> str | None:
+    try:
+        track = sp.track(spotify_id)
+    except Exception:
+        logger.warning("Could not fetch album art for Spotify track %s", spotify_id)
+        return None
+
+    images = (track or {}).get("album", {}).get("images", [])
+    return images[1]["url"] if len(images) > 1 else (images[0]["url"] if images else None)
+
+
 def fetch_album_art_urls(sp, spotify_ids: Iterable[str]) -> list[str | None]:
     spotify_ids = list(spotify_ids)
-    art_urls: list[str | None] = []
-    for spotify_id in spotify_ids:
-        try:
-            track = sp.track(spotify_id)
-        except Exception:
-            logger.warning("Could not fetch album art for Spotify track %s", spotify_id)
-            art_urls.append(None)
-            continue
-
-        images = (track or {}).get("album", {}).get("images", [])
-        art_urls.append(
-            images[1]["url"] if len(images) > 1 else (images[0]["url"] if images else None)
+    unique_ids = list(dict.fromkeys(spotify_ids))
+    if not unique_ids:
+        return []
+    # One request per track, overlapped so latency is paid about once per batch.
+    with ThreadPoolExecutor(max_workers=min(ALBUM_ART_WORKERS, len(unique_ids))) as executor:
+        urls = dict(
+            zip(
+                unique_ids,
+                executor.map(lambda spotify_id: _fetch_album_art_url(sp, spotify_id), unique_ids),
+                strict=True,
+            )
         )
-    return art_urls
+    return [urls[spotify_id] for spotify_id in spotify_ids]
 
 
 def attach_album_art(sp, recs: pd.DataFrame) -> pd.DataFrame:
@@ -33,6 +33,12 @@ def get_cached_catalog_bundle():
     return load_catalog_bundle()
 
 
+@st.cache_resource
+def get_cached_public_spotify_client(config):
+    """Share the app-only client, and its access token, across reruns and sessions."""
+    return get_public_spotify_client(config)
+
+
 try:
     # Streamlit raises when no secrets.toml exists. That is normal for local
     # development, where get_spotify_config falls back to .env.
@@ -234,7 +240,7 @@ if st.session_state.get("spotify_recommend_pending"):
                     top_n=top_n,
                     adjustments=adjustments,
                     sp=user_sp,
-                    public_sp=get_public_spotify_client(spotify_config),
+                    public_sp=get_cached_public_spotify_client(spotify_config),
                     catalog_bundle=get_cached_catalog_bundle(),
                     exclude_spotify_ids=st.session_state.seen_recommendation_ids,
                 )